@@ -0,0 +1,70 @@
+"""Database router sending eligible reads to replicas and writes to primary."""
+
+import random
+from contextvars import ContextVar
+from django.db import connections
+
+PRIMARY = 'default'
+
+# Accounts, sessions and revoked tokens must never be read with lag
+PRIMARY_ONLY_APPS = {'auth', 'sessions', 'users'}
+
+_routing_state = ContextVar('routing_state', default=None)
+
+
+class RoutingState:
+    """Per-request routing decision, switched to primary after any write."""
+
+    def __init__(self, use_replica: bool):
+        self.use_replica = use_replica
+        self.wrote = False
+
+
+def activate(state: RoutingState):
+    """Bind routing state to the current request, returns reset token."""
+    return _routing_state.set(state)
+
+
+def deactivate(token):
+    """Restore routing state bound before activate()."""
+    _routing_state.reset(token)
+
+
+def replica_aliases() -> list:
+    """Return configured replica database aliases."""
+    return [alias for alias in connections if alias != PRIMARY]
+
+
+class PrimaryReplicaRouter:
+    """
+    Route reads to a random replica only while a request opted in.
+
+    Outside requests (management commands, shell) and after the current
+    request has written anything, all queries go to the primary so reads
+    never observe replication lag of their own writes. Models of
+    PRIMARY_ONLY_APPS are always read from the primary, so logouts and
+    account changes take effect without waiting for replication.
+    """
+
+    def db_for_read(self, model, **hints):
+        state = _routing_state.get()
+        if state is None or not state.use_replica:
+            return PRIMARY
+        replicas = replica_aliases()
+        if not replicas or model._meta.app_label in PRIMARY_ONLY_APPS:
+            return PRIMARY
+        return random.choice(replicas)
+
+    def db_for_write(self, model, **hints):
+        state = _routing_state.get()
+        if state is not None:
+            state.use_replica = False
+            state.wrote = True
+        return PRIMARY
+
+    def allow_relation(self, obj1, obj2, **hints):
+        """Primary and replicas hold the same data."""
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        return None
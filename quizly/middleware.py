@@ -1,4 +1,24 @@
-"""Custom middleware to prevent caching of authenticated pages."""
+"""Custom middleware for caching headers, database routing and profiling."""
+
+import os
+import re
+import time
+import uuid
+import random
+import logging
+import cProfile
+from collections import Counter
+from contextlib import ExitStack
+from django.conf import settings
+from django.db import connections
+from rest_framework.exceptions import AuthenticationFailed
+from users.authentication import CookieJWTAuthentication
+
+from . import db_router
+
+logger = logging.getLogger('quizly.profiling')
+
+DB_PIN_COOKIE = 'db_pin'
 
 
 class NoCacheMiddleware:
@@ -22,4 +42,176 @@ class NoCacheMiddleware:
             response['Pragma'] = 'no-cache'
             response['Expires'] = '0'
         
-        return response
\ No newline at end of file
+        return response
+
+
+class ReplicaRoutingMiddleware:
+    """
+    Middleware that lets safe requests on read-heavy paths use replicas.
+
+    GET/HEAD requests below DB_REPLICA_READ_PATHS read from a replica.
+    Any request that writes sets a short-lived cookie that pins the
+    client to the primary for DB_PIN_SECONDS, so users see their own
+    changes (e.g. a freshly created quiz) despite replication lag.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        state = db_router.RoutingState(self._can_use_replica(request))
+        token = db_router.activate(state)
+        try:
+            response = self.get_response(request)
+        finally:
+            db_router.deactivate(token)
+
+        if state.wrote and settings.DB_PIN_SECONDS > 0:
+            response.set_cookie(
+                DB_PIN_COOKIE, '1',
+                max_age=settings.DB_PIN_SECONDS,
+                httponly=True,
+                secure=settings.SECURE_COOKIES,
+                samesite='Lax'
+            )
+        return response
+
+    def _can_use_replica(self, request):
+        """Check method, path and primary pinning cookie."""
+        if request.method not in ('GET', 'HEAD'):
+            return False
+        if DB_PIN_COOKIE in request.COOKIES:
+            return False
+        return request.path.startswith(tuple(settings.DB_REPLICA_READ_PATHS))
+
+
+class ProfilingMiddleware:
+    """
+    Opt-in per-request profiling with SQL query accounting.
+
+    A request is profiled when it is sampled (PROFILING_SAMPLE_RATE) or
+    when a staff user sends the PROFILING_HEADER header. Profiled
+    requests get a Server-Timing header with wall, CPU and SQL time, a
+    log entry listing the slowest and duplicated (N+1) queries, and,
+    if PROFILING_DIR is set, a cProfile dump in a rotating directory.
+    Unprofiled requests only pay for one random() call.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.sample_rate = settings.PROFILING_SAMPLE_RATE
+        self.header = 'HTTP_' + settings.PROFILING_HEADER.upper().replace('-', '_')
+
+    def __call__(self, request):
+        if not self._should_profile(request):
+            return self.get_response(request)
+        return self._profile(request)
+
+    def _should_profile(self, request):
+        """Check sample rate, then staff-only opt-in header."""
+        if self.sample_rate > 0 and random.random() < self.sample_rate:
+            return True
+        return self.header in request.META and _is_staff(request)
+
+    def _profile(self, request):
+        """Run the request with timers, query recorder and optional cProfile."""
+        recorder = _QueryRecorder()
+        profiler = _start_profiler() if settings.PROFILING_DIR else None
+        wall_start, cpu_start = time.perf_counter(), time.thread_time()
+
+        try:
+            with ExitStack() as stack:
+                for connection in connections.all():
+                    stack.enter_context(connection.execute_wrapper(recorder))
+                response = self.get_response(request)
+        finally:
+            if profiler is not None:
+                profiler.disable()
+
+        wall = time.perf_counter() - wall_start
+        cpu = time.thread_time() - cpu_start
+        if profiler is not None:
+            _dump_profile(profiler, request)
+
+        db = sum(duration for _, duration in recorder.queries)
+        response['Server-Timing'] = (
+            f'total;dur={wall * 1000:.1f}, cpu;dur={cpu * 1000:.1f}, '
+            f'db;dur={db * 1000:.1f};desc="{len(recorder.queries)} queries"'
+        )
+        _log_report(request, wall, cpu, db, recorder.queries)
+        return response
+
+
+class _QueryRecorder:
+    """Database execute wrapper collecting (sql, seconds) per query."""
+
+    def __init__(self):
+        self.queries = []
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.queries.append((sql, time.perf_counter() - start))
+
+
+def _is_staff(request) -> bool:
+    """Return True for staff users via session or JWT cookie."""
+    user = getattr(request, 'user', None)
+    if user is not None and user.is_staff:
+        return True
+    try:
+        result = CookieJWTAuthentication().authenticate(request)
+    except AuthenticationFailed:  # includes simplejwt's InvalidToken
+        return False
+    return result is not None and result[0].is_staff
+
+
+def _start_profiler():
+    """Enable cProfile, returns None if another profiler is active."""
+    profiler = cProfile.Profile()
+    try:
+        profiler.enable()
+    except ValueError:
+        return None
+    return profiler
+
+
+def _dump_profile(profiler, request):
+    """Write pstats file and keep only the newest PROFILING_MAX_FILES."""
+    directory = settings.PROFILING_DIR
+    os.makedirs(directory, exist_ok=True)
+    slug = re.sub(r'[^\w]+', '-', request.path).strip('-')[:60] or 'root'
+    name = f"{time.strftime('%Y%m%d-%H%M%S')}-{request.method}-{slug}-{uuid.uuid4().hex[:8]}.prof"
+    profiler.dump_stats(os.path.join(directory, name))
+
+    dumps = sorted(
+        (entry for entry in os.scandir(directory) if entry.name.endswith('.prof')),
+        key=lambda entry: entry.stat().st_mtime
+    )
+    for entry in dumps[:-settings.PROFILING_MAX_FILES]:
+        try:
+            os.remove(entry.path)
+        except FileNotFoundError:
+            pass
+
+
+def _log_report(request, wall, cpu, db, queries):
+    """Log timings, slowest queries and repeated (N+1) queries."""
+    slowest = sorted(queries, key=lambda q: q[1], reverse=True)
+    slowest = slowest[:settings.PROFILING_SLOW_QUERIES]
+    duplicates = [
+        (sql, count) for sql, count in Counter(sql for sql, _ in queries).items()
+        if count >= settings.PROFILING_DUPLICATE_THRESHOLD
+    ]
+    lines = [
+        f"{request.method} {request.path}: total={wall * 1000:.1f}ms "
+        f"cpu={cpu * 1000:.1f}ms db={db * 1000:.1f}ms queries={len(queries)}"
+    ]
+    lines += [f"  slow {duration * 1000:.1f}ms: {sql[:300]}" for sql, duration in slowest]
+    lines += [f"  repeated {count}x (possible N+1): {sql[:300]}" for sql, count in duplicates]
+    if duplicates:
+        logger.warning("\n".join(lines))
+    else:
+        logger.info("\n".join(lines))
@@ -1,5 +1,6 @@
 """Django settings for Quizly Backend project."""
 
+import copy
 from pathlib import Path
 from datetime import timedelta
 from decouple import config, Csv
@@ -39,6 +40,7 @@ INSTALLED_APPS = [
 
 MIDDLEWARE = [
     'django.middleware.security.SecurityMiddleware',
+    'quizly.middleware.ReplicaRoutingMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'corsheaders.middleware.CorsMiddleware',
     'django.middleware.common.CommonMiddleware',
@@ -47,6 +49,7 @@ MIDDLEWARE = [
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
     'quizly.middleware.NoCacheMiddleware',
+    'quizly.middleware.ProfilingMiddleware',
 ]
 
 # CORS Configuration
@@ -80,14 +83,86 @@ TEMPLATES = [
 
 WSGI_APPLICATION = 'quizly.wsgi.application'
 
-# Database
-DATABASES = {
+# Database ("sqlite" for development, "postgresql" for production)
+DB_ENGINE = config('DB_ENGINE', default='sqlite')
+DB_CONN_MAX_AGE = config('DB_CONN_MAX_AGE', default=600, cast=int)
+
+if DB_ENGINE == 'postgresql':
+    # Pooling requires psycopg[pool]; pooled connections replace CONN_MAX_AGE
+    DB_POOL = config('DB_POOL', default=True, cast=bool)
+    DATABASES = {
+        'default': {
+            'ENGINE': 'django.db.backends.postgresql',
+            'NAME': config('DB_NAME', default='quizly'),
+            'USER': config('DB_USER', default='quizly'),
+            'PASSWORD': config('DB_PASSWORD', default=''),
+            'HOST': config('DB_HOST', default='localhost'),
+            'PORT': config('DB_PORT', default='5432'),
+            'CONN_MAX_AGE': 0 if DB_POOL else DB_CONN_MAX_AGE,
+            'CONN_HEALTH_CHECKS': True,
+            'OPTIONS': {
+                'pool': {
+                    'min_size': config('DB_POOL_MIN_SIZE', default=2, cast=int),
+                    'max_size': config('DB_POOL_MAX_SIZE', default=10, cast=int),
+                },
+            } if DB_POOL else {},
+        }
+    }
+else:
+    # WAL lets readers run alongside a writer; IMMEDIATE transactions take
+    # the write lock up front so concurrent writers wait instead of failing
+    # with "database is locked".
+    DATABASES = {
+        'default': {
+            'ENGINE': 'django.db.backends.sqlite3',
+            'NAME': config('DB_NAME', default=str(BASE_DIR / 'db.sqlite3')),
+            'CONN_MAX_AGE': DB_CONN_MAX_AGE,
+            'CONN_HEALTH_CHECKS': True,
+            'OPTIONS': {
+                'timeout': config('DB_BUSY_TIMEOUT', default=20, cast=int),
+                'transaction_mode': 'IMMEDIATE',
+                'init_command': (
+                    'PRAGMA journal_mode=WAL;'
+                    'PRAGMA synchronous=NORMAL;'
+                ),
+            },
+            # File-backed so tests run with WAL like the real database
+            'TEST': {'NAME': str(BASE_DIR / 'test_db.sqlite3')},
+        }
+    }
+
+# Cache (use a shared backend such as Redis when running several workers)
+CACHE_BACKEND = config(
+    'CACHE_BACKEND',
+    default='django.core.cache.backends.locmem.LocMemCache'
+)
+CACHES = {
     'default': {
-        'ENGINE': 'django.db.backends.sqlite3',
-        'NAME': BASE_DIR / 'db.sqlite3',
+        'BACKEND': CACHE_BACKEND,
+        'LOCATION': config('CACHE_LOCATION', default='quizly'),
+        # In-process cache is size-bounded here, shared backends by their own policy
+        'OPTIONS': {
+            'MAX_ENTRIES': config('CACHE_MAX_ENTRIES', default=10000, cast=int),
+        } if CACHE_BACKEND.endswith('LocMemCache') else {},
     }
 }
 
+# Read replicas (comma-separated): SQLite file paths or PostgreSQL hosts
+DB_REPLICAS = config('DB_REPLICAS', default='', cast=Csv())
+for index, replica in enumerate(DB_REPLICAS, start=1):
+    replica_db = copy.deepcopy(DATABASES['default'])
+    replica_db['HOST' if DB_ENGINE == 'postgresql' else 'NAME'] = replica
+    replica_db['TEST'] = {'MIRROR': 'default'}
+    DATABASES[f'replica_{index}'] = replica_db
+
+DATABASE_ROUTERS = ['quizly.db_router.PrimaryReplicaRouter']
+
+# GET requests below these paths may read from replicas
+DB_REPLICA_READ_PATHS = ['/api/quizzes/']
+
+# Seconds a client reads from the primary after it wrote something
+DB_PIN_SECONDS = config('DB_PIN_SECONDS', default=5, cast=int)
+
 # Password validation
 AUTH_PASSWORD_VALIDATORS = [
     {
@@ -116,15 +191,37 @@ STATIC_URL = 'static/'
 # Default primary key field type
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
+# PostgreSQL text search configuration used for the quiz search index
+QUIZ_SEARCH_CONFIG = config('QUIZ_SEARCH_CONFIG', default='simple')
+
+# Seconds a quiz answer key stays cached for scoring attempts
+ANSWER_KEY_CACHE_TTL = config('ANSWER_KEY_CACHE_TTL', default=3600, cast=int)
+
+# Seconds a generated quiz is reused for an identical transcript
+QUIZ_GENERATION_CACHE_TTL = config('QUIZ_GENERATION_CACHE_TTL', default=7 * 24 * 3600, cast=int)
+
 # Audio file storage
 AUDIO_OUTPUT_PATH = BASE_DIR / 'audio'
 
+# Disk budget for reusing downloaded audio across retries (0 disables)
+AUDIO_CACHE_MAX_BYTES = config('AUDIO_CACHE_MAX_BYTES', default=0, cast=int)
+
+# Workspaces older than this (seconds) are treated as crash leftovers
+AUDIO_ORPHAN_MAX_AGE = config('AUDIO_ORPHAN_MAX_AGE', default=6 * 3600, cast=int)
+
 # REST Framework Configuration
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': (
         'users.authentication.CookieJWTAuthentication',
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
+        'users.authentication.RevocableJWTAuthentication',
+    ),
+    'DEFAULT_RENDERER_CLASSES': (
+        'quizly.renderers.FastJSONRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
     ),
+    # Reverse proxies in front of the app; 0 ignores X-Forwarded-For so
+    # clients can't pick their own IP for login throttling
+    'NUM_PROXIES': config('NUM_PROXIES', default=0, cast=int),
 }
 
 # JWT Configuration
@@ -133,5 +230,42 @@ SIMPLE_JWT = {
     'REFRESH_TOKEN_LIFETIME': timedelta(days=1),
 }
 
+# Cache of users resolved from access tokens (per worker, seconds)
+AUTH_USER_CACHE_TTL = config('AUTH_USER_CACHE_TTL', default=30, cast=int)
+AUTH_USER_CACHE_MAX_ENTRIES = config('AUTH_USER_CACHE_MAX_ENTRIES', default=10000, cast=int)
+
+# Build request.user from token claims instead of querying auth_user.
+# Account changes reach other workers through the cache, so use a shared
+# CACHE_BACKEND; with LocMem other workers trust claims until token expiry.
+AUTH_USER_FROM_CLAIMS = config('AUTH_USER_FROM_CLAIMS', default=False, cast=bool)
+
+# Seconds between reloads of tokens revoked by other workers
+TOKEN_REVOCATION_SYNC_INTERVAL = config('TOKEN_REVOCATION_SYNC_INTERVAL', default=5, cast=int)
+
+# Login brute-force limits, checked before password hashing (counters
+# live in the default cache, which must be shared by all workers)
+LOGIN_THROTTLE_USERNAME_RATE = config('LOGIN_THROTTLE_USERNAME_RATE', default='5/min')
+LOGIN_THROTTLE_IP_RATE = config('LOGIN_THROTTLE_IP_RATE', default='20/min')
+
+# Request profiling: sample rate (0.0-1.0) or staff-only opt-in header
+PROFILING_SAMPLE_RATE = config('PROFILING_SAMPLE_RATE', default=0.0, cast=float)
+PROFILING_HEADER = 'X-Profile'
+# Directory for cProfile dumps of profiled requests (empty disables dumps)
+PROFILING_DIR = config('PROFILING_DIR', default='')
+PROFILING_MAX_FILES = config('PROFILING_MAX_FILES', default=50, cast=int)
+PROFILING_SLOW_QUERIES = 5
+PROFILING_DUPLICATE_THRESHOLD = 3
+
+LOGGING = {
+    'version': 1,
+    'disable_existing_loggers': False,
+    'handlers': {
+        'console': {'class': 'logging.StreamHandler'},
+    },
+    'loggers': {
+        'quizly': {'handlers': ['console'], 'level': 'INFO'},
+    },
+}
+
 # API Keys
 GEMINI_API_KEY = config('GEMINI_API_KEY', default='')
\ No newline at end of file
@@ -0,0 +1,77 @@
+"""Tests for the tuned SQLite database profile."""
+
+import threading
+from unittest import skipUnless
+from django.contrib.auth.models import User
+from django.db import connection, transaction
+from django.test import TransactionTestCase
+
+from quizzes.models import Quiz, Question
+
+THREADS = 8
+QUIZZES_PER_THREAD = 15
+
+
+@skipUnless(connection.vendor == 'sqlite', "SQLite profile only")
+class SQLiteConcurrencyTests(TransactionTestCase):
+    """Parallel quiz writes and reads with WAL and IMMEDIATE transactions."""
+
+    def setUp(self):
+        self.user = User.objects.create_user('alice', 'alice@example.com', 'secret-pw-123')
+
+    def test_connection_uses_wal(self):
+        with connection.cursor() as cursor:
+            cursor.execute('PRAGMA journal_mode')
+            self.assertEqual(cursor.fetchone()[0], 'wal')
+
+    def test_parallel_inserts_and_reads(self):
+        errors = []
+        threads = [
+            threading.Thread(target=self._run, args=(self._write_quizzes, n, errors))
+            for n in range(THREADS)
+        ] + [
+            threading.Thread(target=self._run, args=(self._read_quizzes, n, errors))
+            for n in range(THREADS)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(errors, [])
+        self.assertEqual(Quiz.objects.count(), THREADS * QUIZZES_PER_THREAD)
+        self.assertEqual(Question.objects.count(), THREADS * QUIZZES_PER_THREAD * 3)
+
+    def _run(self, func, n, errors):
+        """Run func in a worker thread with its own connection."""
+        try:
+            func(n)
+        except Exception as e:
+            errors.append(e)
+        finally:
+            connection.close()
+
+    def _write_quizzes(self, n):
+        """Read then write in one transaction, like regenerating questions."""
+        for i in range(QUIZZES_PER_THREAD):
+            with transaction.atomic():
+                Quiz.objects.filter(user_id=self.user.pk).count()
+                quiz = Quiz.objects.create(
+                    title=f'Quiz {n}-{i}',
+                    video_url='https://www.youtube.com/watch?v=abc',
+                    user_id=self.user.pk
+                )
+                Question.objects.bulk_create([
+                    Question(
+                        quiz=quiz,
+                        question_title=f'Question {q}',
+                        question_options=['a', 'b', 'c', 'd'],
+                        answer='a'
+                    )
+                    for q in range(3)
+                ])
+
+    def _read_quizzes(self, n):
+        """List quizzes with their questions while writers are running."""
+        for _ in range(QUIZZES_PER_THREAD):
+            list(Quiz.objects.filter(user_id=self.user.pk).prefetch_related('questions'))
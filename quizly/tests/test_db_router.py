@@ -0,0 +1,95 @@
+"""Tests for replica read routing and primary pinning."""
+
+import copy
+from django.contrib.auth.models import User
+from django.db import connections
+from django.test import TransactionTestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework_simplejwt.tokens import AccessToken
+
+from quizly.middleware import DB_PIN_COOKIE
+from quizzes.models import Quiz, Question
+from users.tests.helpers import AuthStateResetMixin
+
+REPLICA = 'replica_test'
+
+
+class ReplicaRoutingTests(AuthStateResetMixin, TransactionTestCase):
+    """Quiz GETs use the replica, writes and pinned clients the primary."""
+
+    @classmethod
+    def setUpClass(cls):
+        # Second alias on the same test database, like a DB_REPLICAS entry
+        # mirrored in tests. Added here since the runner only sets up
+        # aliases known from settings.
+        replica = copy.deepcopy(connections['default'].settings_dict)
+        replica['TEST'] = {**replica['TEST'], 'MIRROR': 'default'}
+        connections.settings[REPLICA] = replica
+        cls.databases = {'default', REPLICA}
+        super().setUpClass()
+
+    @classmethod
+    def tearDownClass(cls):
+        super().tearDownClass()
+        connections[REPLICA].close()
+        del connections[REPLICA]
+        del connections.settings[REPLICA]
+
+    def setUp(self):
+        super().setUp()
+        user = User.objects.create_user('alice', 'alice@example.com', 'secret-pw-123')
+        self.quiz = Quiz.objects.create(
+            title='Quiz',
+            video_url='https://www.youtube.com/watch?v=abc',
+            user=user
+        )
+        self.question = Question.objects.create(
+            quiz=self.quiz,
+            question_title='Question',
+            question_options=['a', 'b', 'c', 'd'],
+            answer='a'
+        )
+        self.client.cookies['access_token'] = str(AccessToken.for_user(user))
+
+    def _tables_by_alias(self, request):
+        """Run request, returns SQL statements seen on primary and replica."""
+        with CaptureQueriesContext(connections['default']) as primary, \
+                CaptureQueriesContext(connections[REPLICA]) as replica:
+            response = request()
+        self.assertLess(response.status_code, 300)
+        return (
+            ' '.join(query['sql'] for query in primary),
+            ' '.join(query['sql'] for query in replica),
+            response
+        )
+
+    def test_unpinned_get_reads_quizzes_from_replica(self):
+        primary, replica, _ = self._tables_by_alias(
+            lambda: self.client.get(reverse('quiz_list'))
+        )
+        self.assertIn('quizzes_quiz', replica)
+        self.assertNotIn('quizzes_quiz', primary)
+        self.assertIn('auth_user', primary)
+        self.assertNotIn('auth_user', replica)
+        self.assertNotIn('users_revokedtoken', replica)
+
+    def test_post_uses_primary_and_pins_client(self):
+        primary, replica, response = self._tables_by_alias(
+            lambda: self.client.post(
+                reverse('quiz_attempts', args=[self.quiz.pk]),
+                {'answers': [{'question': self.question.pk, 'answer': 'a'}]},
+                content_type='application/json'
+            )
+        )
+        self.assertEqual(replica, '')
+        self.assertIn('quizzes_attempt', primary)
+        self.assertIn(DB_PIN_COOKIE, response.cookies)
+
+    def test_pinned_get_reads_primary(self):
+        self.client.cookies[DB_PIN_COOKIE] = '1'
+        primary, replica, _ = self._tables_by_alias(
+            lambda: self.client.get(reverse('quiz_detail', args=[self.quiz.pk]))
+        )
+        self.assertEqual(replica, '')
+        self.assertIn('quizzes_quiz', primary)
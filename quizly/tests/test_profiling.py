@@ -0,0 +1,102 @@
+"""Tests for the opt-in profiling middleware."""
+
+import os
+import shutil
+import tempfile
+from unittest import mock
+from django.contrib.auth.models import User
+from django.test import RequestFactory, TestCase, override_settings
+from django.urls import reverse
+from rest_framework_simplejwt.tokens import AccessToken
+
+from quizly.middleware import ProfilingMiddleware, _log_report
+from users.tests.helpers import AuthStateResetMixin
+
+
+class ProfilingMiddlewareTests(AuthStateResetMixin, TestCase):
+    """Profiled requests get Server-Timing, others are left untouched."""
+
+    def setUp(self):
+        super().setUp()
+        self.user = User.objects.create_user('alice', 'alice@example.com', 'secret-pw-123')
+
+    def _get(self, user=None, headers=None):
+        if user is not None:
+            self.client.cookies['access_token'] = str(AccessToken.for_user(user))
+        return self.client.get(reverse('quiz_list'), headers=headers)
+
+    @override_settings(PROFILING_SAMPLE_RATE=1.0)
+    def test_sampled_request_has_server_timing(self):
+        with self.assertLogs('quizly.profiling', 'INFO'):
+            response = self._get(self.user)
+        self.assertEqual(response.status_code, 200)
+        self.assertRegex(
+            response['Server-Timing'],
+            r'^total;dur=[\d.]+, cpu;dur=[\d.]+, db;dur=[\d.]+;desc="\d+ queries"$'
+        )
+
+    @override_settings(PROFILING_SAMPLE_RATE=0.0)
+    def test_unsampled_request_has_no_header(self):
+        with self.assertNoLogs('quizly.profiling'):
+            self.assertNotIn('Server-Timing', self._get(self.user))
+
+    @override_settings(PROFILING_SAMPLE_RATE=0.0)
+    def test_header_profiles_staff_users(self):
+        self.user.is_staff = True
+        self.user.save()
+        with self.assertLogs('quizly.profiling', 'INFO'):
+            self.assertIn('Server-Timing', self._get(self.user, headers={'X-Profile': '1'}))
+
+    @override_settings(PROFILING_SAMPLE_RATE=0.0)
+    def test_header_ignored_for_other_users(self):
+        with self.assertNoLogs('quizly.profiling'):
+            self.assertNotIn('Server-Timing', self._get(self.user, headers={'X-Profile': '1'}))
+            self.client.cookies.clear()
+            self.assertNotIn('Server-Timing', self._get(headers={'X-Profile': '1'}))
+            self.client.cookies['access_token'] = 'not-a-token'
+            self.assertNotIn('Server-Timing', self._get(headers={'X-Profile': '1'}))
+
+    def test_dumps_rotate(self):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory, ignore_errors=True)
+        with override_settings(PROFILING_SAMPLE_RATE=1.0, PROFILING_DIR=directory, PROFILING_MAX_FILES=2), \
+                self.assertLogs('quizly.profiling', 'INFO'):
+            for _ in range(4):
+                self._get(self.user)
+        dumps = [name for name in os.listdir(directory) if name.endswith('.prof')]
+        self.assertEqual(len(dumps), 2)
+
+    @override_settings(PROFILING_SAMPLE_RATE=1.0, PROFILING_DIR='unused')
+    def test_profiler_disabled_when_view_raises(self):
+        profiler = mock.Mock()
+        middleware = ProfilingMiddleware(mock.Mock(side_effect=RuntimeError("view failed")))
+        with mock.patch('quizly.middleware._start_profiler', return_value=profiler), \
+                mock.patch('quizly.middleware._dump_profile') as dump:
+            with self.assertRaises(RuntimeError):
+                middleware(RequestFactory().get('/api/quizzes/'))
+        profiler.disable.assert_called_once_with()
+        dump.assert_not_called()
+
+
+class QueryReportTests(TestCase):
+    """Repeated queries are reported as possible N+1 problems."""
+
+    def setUp(self):
+        self.request = RequestFactory().get('/api/quizzes/')
+
+    @override_settings(PROFILING_DUPLICATE_THRESHOLD=3)
+    def test_repeated_query_logs_warning(self):
+        repeated = 'SELECT * FROM "quizzes_question" WHERE "quiz_id" = %s'
+        queries = [('SELECT 1', 0.001)] + [(repeated, 0.002)] * 3
+        with self.assertLogs('quizly.profiling', 'WARNING') as logs:
+            _log_report(self.request, 0.1, 0.05, 0.007, queries)
+        self.assertIn(f'repeated 3x (possible N+1): {repeated}', logs.output[0])
+        self.assertIn('queries=4', logs.output[0])
+
+    @override_settings(PROFILING_DUPLICATE_THRESHOLD=3)
+    def test_distinct_queries_log_info(self):
+        queries = [('SELECT 1', 0.001), ('SELECT 2', 0.001)]
+        with self.assertLogs('quizly.profiling', 'INFO') as logs:
+            _log_report(self.request, 0.1, 0.05, 0.002, queries)
+        self.assertEqual(logs.records[0].levelname, 'INFO')
+        self.assertNotIn('repeated', logs.output[0])
@@ -8,7 +8,13 @@ All API routes under /api/ according to endpoint.md:
 - /api/token/refresh/
 - /api/createQuiz/
 - /api/quizzes/
+- /api/quizzes/search/
+- /api/quizzes/export/
+- /api/quizzes/import/
 - /api/quizzes/{id}/
+- /api/quizzes/{id}/regenerate/
+- /api/quizzes/{id}/attempts/
+- /api/quizzes/{id}/stats/
 """
 
 from django.contrib import admin
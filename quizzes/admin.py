@@ -1,8 +1,53 @@
 """Admin configuration for Quiz and Question models."""
 
 from django.contrib import admin
+from django.core.paginator import Paginator
+from django.db import connections
+from django.urls import reverse
+from django.utils.functional import cached_property
+from django.utils.html import format_html
 from .models import Quiz, Question
 
+# Above this many rows unfiltered changelists show an estimated count
+ESTIMATE_COUNT_THRESHOLD = 10000
+
+# Quizzes with more questions link to the question changelist instead
+QUESTION_INLINE_LIMIT = 50
+
+
+class EstimatedCountPaginator(Paginator):
+    """Paginator using table statistics instead of COUNT(*) on large tables."""
+
+    @cached_property
+    def count(self):
+        """Return estimated row count for unfiltered querysets, exact otherwise."""
+        queryset = self.object_list
+        if not queryset.query.where:
+            estimate = _estimate_row_count(queryset.model, queryset.db)
+            if estimate is not None and estimate > ESTIMATE_COUNT_THRESHOLD:
+                return estimate
+        return super().count
+
+
+def _estimate_row_count(model, alias):
+    """Read approximate table size from planner statistics or max rowid."""
+    connection = connections[alias]
+    table = model._meta.db_table
+    with connection.cursor() as cursor:
+        if connection.vendor == 'postgresql':
+            cursor.execute(
+                "SELECT reltuples::bigint FROM pg_class WHERE oid = %s::regclass",
+                [table]
+            )
+        elif connection.vendor == 'sqlite':
+            cursor.execute(f'SELECT MAX(rowid) FROM "{table}"')
+        else:
+            return None
+        row = cursor.fetchone()
+    if row is None or row[0] is None or row[0] < 0:
+        return None
+    return int(row[0])
+
 
 class QuestionInline(admin.TabularInline):
     """Inline editor for Questions within Quiz."""
@@ -10,6 +55,7 @@ class QuestionInline(admin.TabularInline):
     model = Question
     extra = 0
     fields = ['question_title', 'question_options', 'answer']
+    show_change_link = True
 
 
 @admin.register(Quiz)
@@ -17,10 +63,33 @@ class QuizAdmin(admin.ModelAdmin):
     """Admin configuration for Quiz model."""
 
     list_display = ['title', 'user', 'created_at', 'updated_at']
-    list_filter = ['user', 'created_at']
+    list_filter = ['created_at']
+    list_select_related = ['user']
+    date_hierarchy = 'created_at'
     search_fields = ['title', 'description']
-    readonly_fields = ['created_at', 'updated_at']
+    autocomplete_fields = ['user']
+    readonly_fields = ['created_at', 'updated_at', 'questions_link']
     inlines = [QuestionInline]
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+
+    def get_queryset(self, request):
+        """Leave compressed transcripts out of changelist and form queries."""
+        return super().get_queryset(request).defer('transcript_compressed')
+
+    def get_inlines(self, request, obj):
+        """Skip the inline for quizzes with too many questions to render."""
+        if obj is not None and obj.questions.count() > QUESTION_INLINE_LIMIT:
+            return []
+        return super().get_inlines(request, obj)
+
+    def questions_link(self, obj):
+        """Link to the paginated question changelist of this quiz."""
+        if obj.pk is None:
+            return '-'
+        url = reverse('admin:quizzes_question_changelist')
+        return format_html('<a href="{}?quiz__id__exact={}">Show questions</a>', url, obj.pk)
+    questions_link.short_description = 'Questions'
 
 
 @admin.register(Question)
@@ -28,10 +97,13 @@ class QuestionAdmin(admin.ModelAdmin):
     """Admin configuration for Question model."""
 
     list_display = ['question_title_short', 'quiz', 'answer']
-    list_filter = ['quiz']
+    list_select_related = ['quiz']
     search_fields = ['question_title', 'answer']
+    autocomplete_fields = ['quiz']
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
 
     def question_title_short(self, obj):
         """Return truncated question title."""
         return obj.question_title[:50] + "..." if len(obj.question_title) > 50 else obj.question_title
-    question_title_short.short_description = 'Question'
\ No newline at end of file
+    question_title_short.short_description = 'Question'
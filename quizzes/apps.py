@@ -0,0 +1,14 @@
+"""App configuration for the quizzes app."""
+
+from django.apps import AppConfig
+
+
+class QuizzesConfig(AppConfig):
+    """Quizzes app, connects signal handlers."""
+
+    default_auto_field = 'django.db.models.BigAutoField'
+    name = 'quizzes'
+
+    def ready(self):
+        """Register signal handlers."""
+        from . import signals  # noqa: F401
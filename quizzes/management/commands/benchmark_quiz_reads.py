@@ -0,0 +1,81 @@
+"""Management command comparing CPU time of the quiz read paths."""
+
+import time
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from rest_framework.renderers import JSONRenderer
+
+from quizly.renderers import FastJSONRenderer
+from quizzes.models import Quiz, Question
+from quizzes.serializers import QuizSerializer, serialize_quiz_list, serialize_quiz_detail
+
+
+class Command(BaseCommand):
+    """Time serializer vs. values() read path on throwaway data."""
+
+    help = "Compare CPU time per quiz list/detail response of both read paths."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--quizzes', type=int, default=100)
+        parser.add_argument('--questions', type=int, default=10)
+        parser.add_argument('--repeat', type=int, default=20)
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            user = self._create_data(options['quizzes'], options['questions'])
+            quizzes = Quiz.objects.filter(user=user)
+            quiz = quizzes.defer('transcript_compressed').first()
+            paths = {
+                'list': (
+                    lambda: JSONRenderer().render(
+                        QuizSerializer(quizzes.prefetch_related('questions'), many=True).data
+                    ),
+                    lambda: FastJSONRenderer().render(serialize_quiz_list(quizzes)),
+                ),
+                'detail': (
+                    lambda: JSONRenderer().render(QuizSerializer(quiz).data),
+                    lambda: FastJSONRenderer().render(serialize_quiz_detail(quiz)),
+                ),
+            }
+            for name, (serializer_path, fast_path) in paths.items():
+                before = _cpu_ms(serializer_path, options['repeat'])
+                after = _cpu_ms(fast_path, options['repeat'])
+                speedup = f" ({before / after:.1f}x)" if after else ""
+                self.stdout.write(
+                    f"{name}: serializer {before:.2f} ms, fast path {after:.2f} ms{speedup}"
+                )
+            transaction.set_rollback(True)
+
+    def _create_data(self, quiz_count: int, question_count: int):
+        """Insert benchmark rows, rolled back when the command ends."""
+        user = User.objects.create(username='benchmark-quiz-reads')
+        quizzes = Quiz.objects.bulk_create([
+            Quiz(
+                title=f'Benchmark quiz {i}',
+                description='Benchmark description',
+                video_url='https://www.youtube.com/watch?v=benchmark',
+                user=user
+            )
+            for i in range(quiz_count)
+        ])
+        Question.objects.bulk_create([
+            Question(
+                quiz=quiz,
+                question_title=f'Benchmark question {q}',
+                question_options=['Option A', 'Option B', 'Option C', 'Option D'],
+                answer='Option A'
+            )
+            for quiz in quizzes
+            for q in range(question_count)
+        ])
+        return user
+
+
+def _cpu_ms(func, repeat: int) -> float:
+    """Return average process CPU time of func in milliseconds."""
+    func()
+    start = time.process_time()
+    for _ in range(repeat):
+        func()
+    return (time.process_time() - start) / repeat * 1000
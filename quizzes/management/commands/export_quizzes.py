@@ -0,0 +1,39 @@
+"""Management command exporting a user's quizzes as NDJSON."""
+
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+
+from quizzes.models import Quiz
+from quizzes.utils.quiz_transfer import iter_export_lines
+
+
+class Command(BaseCommand):
+    """Stream quizzes to a file or stdout, one JSON object per line."""
+
+    help = "Export quizzes of one user (or all users) as NDJSON."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--user', help="Username, exports all quizzes if omitted.")
+        parser.add_argument('--output', '-o', help="Output file, defaults to stdout.")
+        parser.add_argument('--chunk-size', type=int, default=500)
+
+    def handle(self, *args, **options):
+        quizzes = Quiz.objects.all()
+        if options['user']:
+            quizzes = quizzes.filter(user=_get_user(options['user']))
+        lines = iter_export_lines(quizzes, chunk_size=options['chunk_size'])
+
+        if not options['output']:
+            for line in lines:
+                self.stdout.write(line, ending='')
+            return
+        with open(options['output'], 'w', encoding='utf-8') as f:
+            f.writelines(lines)
+
+
+def _get_user(username):
+    """Return user by username or fail with a command error."""
+    try:
+        return User.objects.get(username=username)
+    except User.DoesNotExist:
+        raise CommandError(f"User '{username}' does not exist.")
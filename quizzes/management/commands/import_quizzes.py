@@ -0,0 +1,34 @@
+"""Management command importing NDJSON quizzes for a user."""
+
+import sys
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+
+from quizzes.utils.quiz_transfer import import_lines
+
+
+class Command(BaseCommand):
+    """Import quizzes exported with export_quizzes into one account."""
+
+    help = "Import quizzes from an NDJSON file ('-' for stdin)."
+
+    def add_arguments(self, parser):
+        parser.add_argument('path')
+        parser.add_argument('--user', required=True, help="Owner of imported quizzes.")
+        parser.add_argument('--batch-size', type=int, default=500)
+
+    def handle(self, *args, **options):
+        try:
+            user = User.objects.get(username=options['user'])
+        except User.DoesNotExist:
+            raise CommandError(f"User '{options['user']}' does not exist.")
+
+        try:
+            if options['path'] == '-':
+                imported = import_lines(sys.stdin, user, options['batch_size'])
+            else:
+                with open(options['path'], encoding='utf-8') as f:
+                    imported = import_lines(f, user, options['batch_size'])
+        except ValueError as e:
+            raise CommandError(str(e))
+        self.stdout.write(self.style.SUCCESS(f"Imported {imported} quizzes."))
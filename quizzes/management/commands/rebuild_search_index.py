@@ -0,0 +1,28 @@
+"""Management command (re)building the quiz full-text search index."""
+
+from django.core.management.base import BaseCommand
+
+from quizzes.models import Quiz
+from quizzes.search import index_quizzes
+
+
+class Command(BaseCommand):
+    """Backfill the search index for all existing quizzes in chunks."""
+
+    help = "Index all quizzes for full-text search."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--chunk-size', type=int, default=500)
+
+    def handle(self, *args, **options):
+        chunk_size = options['chunk_size']
+        ids = Quiz.objects.order_by('pk').values_list('pk', flat=True)
+        last_id, total = 0, 0
+        while True:
+            chunk = list(ids.filter(pk__gt=last_id)[:chunk_size])
+            if not chunk:
+                break
+            index_quizzes(chunk)
+            total += len(chunk)
+            last_id = chunk[-1]
+        self.stdout.write(self.style.SUCCESS(f"Indexed {total} quizzes."))
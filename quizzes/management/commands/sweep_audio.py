@@ -0,0 +1,26 @@
+"""Management command removing orphaned audio workspaces and files."""
+
+import os
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from quizzes.utils.audio_workspace import AudioCache, sweep_orphans, CACHE_DIR
+
+
+class Command(BaseCommand):
+    """Sweep orphaned audio, intended to run periodically (cron/systemd)."""
+
+    help = "Delete audio workspaces left by crashed workers and trim the audio cache."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--max-age',
+            type=int,
+            default=None,
+            help="Minimum age in seconds (default: AUDIO_ORPHAN_MAX_AGE).",
+        )
+
+    def handle(self, *args, **options):
+        removed = sweep_orphans(max_age=options['max_age'])
+        AudioCache(os.path.join(settings.AUDIO_OUTPUT_PATH, CACHE_DIR)).evict()
+        self.stdout.write(self.style.SUCCESS(f"Removed {removed} orphaned entries."))
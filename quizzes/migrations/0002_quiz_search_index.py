@@ -0,0 +1,52 @@
+# Full-text search index, created per database vendor
+
+from django.db import migrations
+
+SQLITE_CREATE = [
+    "CREATE VIRTUAL TABLE IF NOT EXISTS quizzes_quiz_fts USING fts5("
+    "owner, title, description, questions, "
+    "tokenize='unicode61 remove_diacritics 2')",
+]
+SQLITE_DROP = [
+    "DROP TABLE IF EXISTS quizzes_quiz_fts",
+]
+POSTGRESQL_CREATE = [
+    "CREATE TABLE IF NOT EXISTS quizzes_quiz_search ("
+    "quiz_id bigint PRIMARY KEY "
+    "REFERENCES quizzes_quiz (id) ON DELETE CASCADE "
+    "DEFERRABLE INITIALLY DEFERRED, "
+    "user_id integer NOT NULL, "
+    "document tsvector NOT NULL)",
+    "CREATE INDEX IF NOT EXISTS quizzes_quiz_search_document_idx "
+    "ON quizzes_quiz_search USING GIN (document)",
+    "CREATE INDEX IF NOT EXISTS quizzes_quiz_search_user_idx "
+    "ON quizzes_quiz_search (user_id)",
+]
+POSTGRESQL_DROP = [
+    "DROP TABLE IF EXISTS quizzes_quiz_search",
+]
+
+
+def _run(schema_editor, statements):
+    """Execute statements for the current vendor, other vendors are skipped."""
+    for sql in statements.get(schema_editor.connection.vendor, []):
+        schema_editor.execute(sql)
+
+
+def create_search_index(apps, schema_editor):
+    _run(schema_editor, {'sqlite': SQLITE_CREATE, 'postgresql': POSTGRESQL_CREATE})
+
+
+def drop_search_index(apps, schema_editor):
+    _run(schema_editor, {'sqlite': SQLITE_DROP, 'postgresql': POSTGRESQL_DROP})
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('quizzes', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 6.0.1 on 2026-10-19 09:33
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('quizzes', '0002_quiz_search_index'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='quiz',
+            name='created_at',
+            field=models.DateTimeField(auto_now_add=True, db_index=True),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 6.0.1 on 2026-10-19 09:36
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('quizzes', '0003_quiz_created_at_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='quiz',
+            name='transcript_compressed',
+            field=models.BinaryField(blank=True, default=b''),
+        ),
+    ]
@@ -1,5 +1,6 @@
-"""Quiz and Question models according to endpoint.md response structure."""
+"""Quiz, Question and Attempt models according to endpoint.md response structure."""
 
+import zlib
 from django.db import models
 from django.contrib.auth.models import User
 
@@ -15,7 +16,8 @@ class Quiz(models.Model):
         on_delete=models.CASCADE,
         related_name='quizzes'
     )
-    created_at = models.DateTimeField(auto_now_add=True)
+    transcript_compressed = models.BinaryField(blank=True, default=b'', editable=False)
+    created_at = models.DateTimeField(auto_now_add=True, db_index=True)
     updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
@@ -26,6 +28,17 @@ class Quiz(models.Model):
     def __str__(self):
         return self.title
 
+    @property
+    def transcript(self) -> str:
+        """Video transcript, stored zlib-compressed."""
+        if not self.transcript_compressed:
+            return ''
+        return zlib.decompress(bytes(self.transcript_compressed)).decode('utf-8')
+
+    @transcript.setter
+    def transcript(self, text: str):
+        self.transcript_compressed = zlib.compress(text.encode('utf-8')) if text else b''
+
 
 class Question(models.Model):
     """Question model storing quiz questions with options as JSON array."""
@@ -47,4 +60,79 @@ class Question(models.Model):
         ordering = ['id']
 
     def __str__(self):
-        return f"{self.quiz.title} - {self.question_title[:50]}"
\ No newline at end of file
+        return f"{self.quiz.title} - {self.question_title[:50]}"
+
+
+class Attempt(models.Model):
+    """One submitted run through a quiz with its server-side score."""
+
+    quiz = models.ForeignKey(
+        Quiz,
+        on_delete=models.CASCADE,
+        related_name='attempts'
+    )
+    user = models.ForeignKey(
+        User,
+        on_delete=models.CASCADE,
+        related_name='quiz_attempts'
+    )
+    score = models.PositiveIntegerField()
+    total = models.PositiveIntegerField()
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        verbose_name = 'Attempt'
+        verbose_name_plural = 'Attempts'
+        ordering = ['-created_at']
+
+    def __str__(self):
+        return f"{self.quiz_id} - {self.score}/{self.total}"
+
+
+class AttemptAnswer(models.Model):
+    """Answer given to one question within an attempt."""
+
+    attempt = models.ForeignKey(
+        Attempt,
+        on_delete=models.CASCADE,
+        related_name='answers'
+    )
+    question = models.ForeignKey(
+        Question,
+        on_delete=models.SET_NULL,
+        null=True,
+        related_name='attempt_answers'
+    )
+    selected_answer = models.CharField(max_length=500, blank=True)
+    is_correct = models.BooleanField()
+
+    class Meta:
+        verbose_name = 'Attempt Answer'
+        verbose_name_plural = 'Attempt Answers'
+        ordering = ['id']
+
+    def __str__(self):
+        return self.selected_answer
+
+
+class QuizStats(models.Model):
+    """Aggregate attempt statistics, updated incrementally per submission."""
+
+    quiz = models.OneToOneField(
+        Quiz,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name='stats'
+    )
+    attempt_count = models.PositiveIntegerField(default=0)
+    score_sum = models.PositiveBigIntegerField(default=0)
+    total_sum = models.PositiveBigIntegerField(default=0)
+    best_score = models.PositiveIntegerField(default=0)
+    last_attempt_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        verbose_name = 'Quiz Stats'
+        verbose_name_plural = 'Quiz Stats'
+
+    def __str__(self):
+        return f"{self.quiz_id} - {self.attempt_count} attempts"
@@ -0,0 +1,281 @@
+"""Full-text search over quiz titles, descriptions and questions.
+
+Each quiz is indexed as one document. SQLite uses an FTS5 virtual table,
+PostgreSQL a side table with a weighted tsvector and a GIN index (both
+created in migration 0002). Other vendors fall back to icontains filters.
+"""
+
+import re
+import weakref
+import threading
+from django.conf import settings
+from django.db import connections, router, transaction
+from django.db.models import Q
+
+from .models import Quiz
+
+FTS_TABLE = 'quizzes_quiz_fts'
+PG_TABLE = 'quizzes_quiz_search'
+
+
+class _PendingState(threading.local):
+    """Per thread, like connections: alias -> weakref to its _PendingIndex."""
+
+    def __init__(self):
+        self.refs = {}
+
+
+_pending_state = _PendingState()
+
+
+def index_quizzes(quiz_ids):
+    """
+    Insert or refresh index documents for the given quizzes.
+
+    Quizzes that no longer exist are removed from the index.
+
+    Args:
+        quiz_ids: Iterable of quiz primary keys.
+    """
+    quiz_ids = list(quiz_ids)
+    alias = router.db_for_write(Quiz)
+    backend = _get_backend(connections[alias])
+    if backend is None or not quiz_ids:
+        return
+    quizzes = (
+        Quiz.objects.using(alias)
+        .filter(pk__in=quiz_ids)
+        .prefetch_related('questions')
+    )
+    documents = [_build_document(quiz) for quiz in quizzes]
+    with transaction.atomic(using=alias):
+        with connections[alias].cursor() as cursor:
+            backend.delete(cursor, quiz_ids)
+            backend.insert(cursor, documents)
+
+
+def reindex_on_commit(quiz_id) -> bool:
+    """
+    Queue a quiz for reindexing once the current transaction has committed.
+
+    All quizzes queued within one transaction share a single on-commit
+    callback, so a quiz saved together with its questions is indexed
+    once. Outside a transaction the quiz is indexed right away.
+
+    Returns:
+        False if the quiz was already queued in this transaction.
+    """
+    alias = router.db_for_write(Quiz)
+    pending = _get_pending(alias)
+    if pending is not None:
+        if quiz_id in pending.quiz_ids:
+            return False
+        pending.quiz_ids.add(quiz_id)
+        return True
+    pending = _PendingIndex(quiz_id)
+    # Weak reference only: a rollback discards the callback and thereby
+    # ends the pending state, a commit runs it and marks it done.
+    _pending_state.refs[alias] = weakref.ref(pending)
+    transaction.on_commit(pending, using=alias)
+    return True
+
+
+def _get_pending(alias):
+    """Return the callback still waiting for this thread's transaction, or None."""
+    ref = _pending_state.refs.get(alias)
+    pending = ref() if ref is not None else None
+    if pending is None or pending.done:
+        return None
+    return pending
+
+
+class _PendingIndex:
+    """On-commit callback indexing every quiz changed in one transaction."""
+
+    def __init__(self, quiz_id):
+        self.quiz_ids = {quiz_id}
+        self.done = False
+
+    def __call__(self):
+        self.done = True
+        index_quizzes(self.quiz_ids)
+
+
+def remove_quizzes(quiz_ids):
+    """Remove index documents for the given quiz primary keys."""
+    quiz_ids = list(quiz_ids)
+    alias = router.db_for_write(Quiz)
+    backend = _get_backend(connections[alias])
+    if backend is None or not quiz_ids:
+        return
+    with connections[alias].cursor() as cursor:
+        backend.delete(cursor, quiz_ids)
+
+
+def search_quizzes(user, query: str, limit: int, offset: int) -> tuple:
+    """
+    Search one user's quizzes ranked by relevance.
+
+    Args:
+        user: Owner whose quizzes are searched.
+        query: Free text search query.
+        limit: Maximum number of results.
+        offset: Number of results to skip.
+
+    Returns:
+        Tuple of total match count and list of quiz IDs in rank order.
+    """
+    alias = router.db_for_read(Quiz)
+    backend = _get_backend(connections[alias])
+    if backend is None:
+        return _search_fallback(alias, user, query, limit, offset)
+    with connections[alias].cursor() as cursor:
+        return backend.search(cursor, user.pk, query, limit, offset)
+
+
+def _build_document(quiz) -> tuple:
+    """Return (quiz_id, user_id, title, description, questions text)."""
+    parts = []
+    for question in quiz.questions.all():
+        parts.append(question.question_title)
+        parts.extend(str(option) for option in question.question_options)
+    return (quiz.pk, quiz.user_id, quiz.title, quiz.description, '\n'.join(parts))
+
+
+def _search_fallback(alias, user, query, limit, offset) -> tuple:
+    """Unindexed substring search for databases without a text index."""
+    matches = (
+        Quiz.objects.using(alias)
+        .filter(user=user)
+        .filter(
+            Q(title__icontains=query)
+            | Q(description__icontains=query)
+            | Q(questions__question_title__icontains=query)
+        )
+        .distinct()
+    )
+    ids = list(matches.values_list('pk', flat=True)[offset:offset + limit])
+    return matches.count(), ids
+
+
+def _get_backend(connection):
+    """Return index backend matching the connection vendor, or None."""
+    return _BACKENDS.get(connection.vendor)
+
+
+class _SQLiteBackend:
+    """FTS5 table with the quiz ID as rowid and an indexed owner token."""
+
+    @staticmethod
+    def delete(cursor, quiz_ids):
+        cursor.executemany(
+            f"DELETE FROM {FTS_TABLE} WHERE rowid = %s",
+            [(quiz_id,) for quiz_id in quiz_ids]
+        )
+
+    @staticmethod
+    def insert(cursor, documents):
+        cursor.executemany(
+            f"INSERT INTO {FTS_TABLE} "
+            "(rowid, owner, title, description, questions) "
+            "VALUES (%s, %s, %s, %s, %s)",
+            [
+                (quiz_id, _owner_token(user_id), title, description, questions)
+                for quiz_id, user_id, title, description, questions in documents
+            ]
+        )
+
+    @staticmethod
+    def search(cursor, user_id, query, limit, offset):
+        match = _fts5_match(user_id, query)
+        if match is None:
+            return 0, []
+        cursor.execute(
+            f"SELECT COUNT(*) FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH %s",
+            [match]
+        )
+        total = cursor.fetchone()[0]
+        cursor.execute(
+            f"SELECT rowid FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH %s "
+            f"ORDER BY bm25({FTS_TABLE}, 0.0, 10.0, 5.0, 1.0) "
+            "LIMIT %s OFFSET %s",
+            [match, limit, offset]
+        )
+        return total, [row[0] for row in cursor.fetchall()]
+
+
+class _PostgreSQLBackend:
+    """Side table with a weighted tsvector document and a GIN index."""
+
+    @staticmethod
+    def delete(cursor, quiz_ids):
+        cursor.execute(
+            f"DELETE FROM {PG_TABLE} WHERE quiz_id = ANY(%s)",
+            [list(quiz_ids)]
+        )
+
+    @staticmethod
+    def insert(cursor, documents):
+        config = settings.QUIZ_SEARCH_CONFIG
+        cursor.executemany(
+            f"INSERT INTO {PG_TABLE} (quiz_id, user_id, document) VALUES ("
+            "%s, %s, "
+            "setweight(to_tsvector(%s::regconfig, %s), 'A') || "
+            "setweight(to_tsvector(%s::regconfig, %s), 'B') || "
+            "setweight(to_tsvector(%s::regconfig, %s), 'C'))",
+            [
+                (quiz_id, user_id, config, title, config, description,
+                 config, questions)
+                for quiz_id, user_id, title, description, questions in documents
+            ]
+        )
+
+    @staticmethod
+    def search(cursor, user_id, query, limit, offset):
+        config = settings.QUIZ_SEARCH_CONFIG
+        cursor.execute(
+            f"SELECT COUNT(*) FROM {PG_TABLE} "
+            "WHERE user_id = %s "
+            "AND document @@ websearch_to_tsquery(%s::regconfig, %s)",
+            [user_id, config, query]
+        )
+        total = cursor.fetchone()[0]
+        cursor.execute(
+            f"SELECT quiz_id FROM {PG_TABLE}, "
+            "websearch_to_tsquery(%s::regconfig, %s) AS query "
+            "WHERE user_id = %s AND document @@ query "
+            "ORDER BY ts_rank(document, query) DESC, quiz_id DESC "
+            "LIMIT %s OFFSET %s",
+            [config, query, user_id, limit, offset]
+        )
+        return total, [row[0] for row in cursor.fetchall()]
+
+
+_BACKENDS = {
+    'sqlite': _SQLiteBackend,
+    'postgresql': _PostgreSQLBackend,
+}
+
+
+def _owner_token(user_id) -> str:
+    """Indexed owner token, lets FTS5 restrict matches to one user."""
+    return f"u{user_id}"
+
+
+def _fts5_match(user_id, query: str):
+    """
+    Translate free text into an FTS5 MATCH expression.
+
+    Every word becomes a quoted phrase (so user input can't inject FTS5
+    syntax), the last word matches as prefix, and results are limited to
+    the owner's documents.
+    """
+    words = re.findall(r'\w+', query)
+    if not words:
+        return None
+    phrases = [f'"{word}"' for word in words]
+    phrases[-1] += '*'
+    return (
+        f'owner : "{_owner_token(user_id)}" AND '
+        f'{{title description questions}} : ({" ".join(phrases)})'
+    )
@@ -1,5 +1,6 @@
 """Quiz and Question serializers matching endpoint.md response structure."""
 
+from django.utils import timezone
 from rest_framework import serializers
 from .models import Quiz, Question
 
@@ -39,6 +40,60 @@ class QuizSerializer(serializers.ModelSerializer):
         read_only_fields = ['id', 'created_at', 'updated_at']
 
 
+_QUIZ_FIELDS = [f for f in QuizSerializer.Meta.fields if f != 'questions']
+
+
+def serialize_quiz_list(quizzes) -> list:
+    """
+    Read-only fast path producing QuizSerializer(many=True) output.
+
+    Fetches quiz and question rows with values() in two queries and
+    builds plain dicts, skipping ModelSerializer field machinery.
+
+    Args:
+        quizzes: Quiz queryset to serialize.
+
+    Returns:
+        List of quiz dicts with nested questions.
+    """
+    rows = list(quizzes.values(*_QUIZ_FIELDS))
+    by_id = {}
+    for row in rows:
+        _format_datetimes(row)
+        row['questions'] = []
+        by_id[row['id']] = row
+    if by_id:
+        questions = Question.objects.filter(
+            quiz__in=quizzes.values('pk')
+        ).values('quiz_id', *QuestionSerializer.Meta.fields)
+        for question in questions:
+            quiz_row = by_id.get(question.pop('quiz_id'))
+            if quiz_row is not None:
+                quiz_row['questions'].append(_format_datetimes(question))
+    return rows
+
+
+def serialize_quiz_detail(quiz) -> dict:
+    """Fast path producing QuizSerializer(quiz).data for a loaded quiz."""
+    data = {field: getattr(quiz, field) for field in _QUIZ_FIELDS}
+    _format_datetimes(data)
+    data['questions'] = [
+        _format_datetimes(question)
+        for question in quiz.questions.values(*QuestionSerializer.Meta.fields)
+    ]
+    return data
+
+
+def _format_datetimes(row: dict) -> dict:
+    """Format created_at/updated_at exactly like DRF's DateTimeField."""
+    for field in ('created_at', 'updated_at'):
+        value = timezone.localtime(row[field]).isoformat()
+        if value.endswith('+00:00'):
+            value = value[:-6] + 'Z'
+        row[field] = value
+    return row
+
+
 class QuizUpdateSerializer(serializers.ModelSerializer):
     """Serializer for PATCH /api/quizzes/{id}/."""
 
@@ -51,6 +106,7 @@ class CreateQuizSerializer(serializers.Serializer):
     """Serializer for POST /api/createQuiz/."""
 
     url = serializers.URLField()
+    fresh = serializers.BooleanField(required=False, default=False)
 
     def validate_url(self, value):
         """Validate YouTube URL."""
@@ -58,4 +114,42 @@ class CreateQuizSerializer(serializers.Serializer):
             raise serializers.ValidationError(
                 "URL must be a valid YouTube URL."
             )
-        return value
\ No newline at end of file
+        return value
+
+
+class RegenerateQuizSerializer(serializers.Serializer):
+    """Serializer for POST /api/quizzes/{id}/regenerate/."""
+
+    question_ids = serializers.ListField(
+        child=serializers.IntegerField(),
+        required=False,
+        allow_empty=False
+    )
+
+
+class AttemptAnswerSerializer(serializers.Serializer):
+    """Single answer within an attempt submission."""
+
+    question = serializers.IntegerField()
+    answer = serializers.CharField(max_length=500, allow_blank=True)
+
+
+class AttemptSubmitSerializer(serializers.Serializer):
+    """Serializer for POST /api/quizzes/{id}/attempts/."""
+
+    answers = AttemptAnswerSerializer(many=True, allow_empty=False)
+
+    def validate_answers(self, value):
+        """Validate that every question is answered at most once."""
+        question_ids = [a['question'] for a in value]
+        if len(question_ids) != len(set(question_ids)):
+            raise serializers.ValidationError("Each question may be answered only once.")
+        return value
+
+
+class QuizSearchSerializer(serializers.Serializer):
+    """Query parameters for GET /api/quizzes/search/."""
+
+    q = serializers.CharField(max_length=200)
+    page = serializers.IntegerField(min_value=1, default=1)
+    page_size = serializers.IntegerField(min_value=1, max_value=50, default=10)
@@ -2,7 +2,12 @@
 """Quiz services - YouTube download, transcription and quiz generation."""
 
 from .youtube_service import download_audio
-from .gemini_service import generate_quiz
+from .gemini_service import generate_quiz, get_generation_cache_stats
 from ..utils.quiz_generator import transcribe_audio
 
-__all__ = ['download_audio', 'transcribe_audio', 'generate_quiz']
+__all__ = [
+    'download_audio',
+    'transcribe_audio',
+    'generate_quiz',
+    'get_generation_cache_stats',
+]
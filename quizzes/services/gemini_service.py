@@ -2,31 +2,105 @@
 
 import re
 import json
+import hashlib
+import unicodedata
 from google import genai
 from django.conf import settings
+from django.core.cache import cache
 
+GEMINI_MODEL = "gemini-2.5-flash"
 
-def generate_quiz(transcript: str) -> dict:
+CACHE_PREFIX = 'quiz-generation'
+
+
+def generate_quiz(transcript: str, use_cache: bool = True) -> dict:
     """
     Generate quiz questions from transcript using Gemini 2.5 Flash.
 
+    Results are cached by normalized transcript, model and prompt
+    version, so identical transcripts (re-uploads, mirrors) skip the
+    Gemini call. Fresh results are always written back to the cache.
+
     Args:
         transcript: Text content to generate questions from.
+        use_cache: Set to False to force a new Gemini call.
 
     Returns:
         Dictionary with title, description and list of questions.
 
     Raises:
-        ValueError: If GEMINI_API_KEY is not configured.
+        ValueError: If GEMINI_API_KEY is not configured or the response
+            does not have the expected quiz structure.
         JSONDecodeError: If response is not valid JSON.
     """
+    key = _generation_cache_key(transcript)
+    if use_cache:
+        cached = cache.get(key)
+        if cached is not None and _is_valid_quiz(cached):
+            _count('hits')
+            return cached
+        _count('misses')
+    else:
+        _count('bypassed')
+
     client = _get_gemini_client()
     prompt = _build_quiz_prompt(transcript)
     response = client.models.generate_content(
-        model="gemini-2.5-flash",
+        model=GEMINI_MODEL,
         contents=prompt
     )
-    return _parse_quiz_response(response.text)
+    quiz_data = validate_quiz_data(_parse_quiz_response(response.text))
+    cache.set(key, quiz_data, timeout=settings.QUIZ_GENERATION_CACHE_TTL)
+    return quiz_data
+
+
+def validate_quiz_data(data) -> dict:
+    """
+    Check that generated quiz data can be saved as quiz with questions.
+
+    Args:
+        data: Parsed Gemini response.
+
+    Returns:
+        The unchanged data.
+
+    Raises:
+        ValueError: If title, description or a non-empty questions list
+            is missing, or a question lacks title, options or answer.
+    """
+    if not isinstance(data, dict):
+        raise ValueError("Generated quiz is not a JSON object.")
+    for field in ('title', 'description'):
+        if not isinstance(data.get(field), str):
+            raise ValueError(f"Generated quiz has no {field}.")
+    questions = data.get('questions')
+    if not isinstance(questions, list) or not questions:
+        raise ValueError("Generated quiz has no questions.")
+    for question in questions:
+        if not (
+            isinstance(question, dict)
+            and isinstance(question.get('question_title'), str)
+            and isinstance(question.get('question_options'), list)
+            and isinstance(question.get('answer'), str)
+        ):
+            raise ValueError(
+                "Generated question needs question_title, question_options and answer."
+            )
+    return data
+
+
+def get_generation_cache_stats() -> dict:
+    """
+    Return generation cache counters.
+
+    Returns:
+        Dictionary with hits, misses, bypassed and saved_calls (= hits).
+    """
+    names = ['hits', 'misses', 'bypassed']
+    values = cache.get_many([f'{CACHE_PREFIX}:stats:{name}' for name in names])
+    stats = {name: values.get(f'{CACHE_PREFIX}:stats:{name}', 0) for name in names}
+    stats['saved_calls'] = stats['hits']
+    return stats
 
 
 def _get_gemini_client():
@@ -94,3 +168,43 @@ def _parse_quiz_response(text: str) -> dict:
     cleaned = re.sub(r'^```\s*', '', cleaned)
     cleaned = re.sub(r'\s*```$', '', cleaned)
     return json.loads(cleaned.strip())
+
+
+def _generation_cache_key(transcript: str) -> str:
+    """
+    Build cache key from normalized transcript, model and prompt version.
+
+    Args:
+        transcript: Raw transcript text.
+
+    Returns:
+        Cache key; changes whenever the prompt template or model changes.
+    """
+    normalized = ' '.join(unicodedata.normalize('NFKC', transcript).split()).casefold()
+    digest = hashlib.sha256(normalized.encode('utf-8')).hexdigest()
+    return f'{CACHE_PREFIX}:{GEMINI_MODEL}:{PROMPT_VERSION}:{digest}'
+
+
+def _is_valid_quiz(data) -> bool:
+    """Return True if cached quiz data passes validate_quiz_data()."""
+    try:
+        validate_quiz_data(data)
+    except ValueError:
+        return False
+    return True
+
+
+def _count(name: str):
+    """Increment a generation cache counter."""
+    key = f'{CACHE_PREFIX}:stats:{name}'
+    cache.add(key, 0, timeout=None)
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.set(key, 1, timeout=None)
+
+
+# Derived from the template itself, so editing the prompt invalidates entries
+PROMPT_VERSION = hashlib.sha256(
+    _build_quiz_prompt('\0').encode('utf-8')
+).hexdigest()[:12]
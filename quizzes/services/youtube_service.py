@@ -1,6 +1,8 @@
 """YouTube audio download service using yt-dlp."""
 
 import os
+import re
+import hashlib
 import yt_dlp
 from django.conf import settings
 
@@ -14,18 +16,41 @@ def extract_video_id(url: str) -> str:
     return url
 
 
-def download_audio(url: str) -> str:
-    """Download audio from YouTube video and return file path."""
-    video_id = extract_video_id(url)
-    output_path = settings.AUDIO_OUTPUT_PATH
-    os.makedirs(output_path, exist_ok=True)
+def download_audio(url: str, workspace=None) -> str:
+    """
+    Download audio from YouTube video and return file path.
+
+    With an AudioWorkspace the file is placed inside the workspace and
+    served from the audio cache when the same video was fetched before.
+    """
+    video_id = _safe_video_id(url)
+    if workspace is not None:
+        cached = workspace.checkout(video_id)
+        if cached:
+            return cached
+        output_path = workspace.path
+    else:
+        output_path = settings.AUDIO_OUTPUT_PATH
+        os.makedirs(output_path, exist_ok=True)
 
     tmp_filename = os.path.join(output_path, f"{video_id}.%(ext)s")
     ydl_opts = _get_download_options(tmp_filename)
 
     with yt_dlp.YoutubeDL(ydl_opts) as ydl:
         info = ydl.extract_info(url, download=True)
-        return ydl.prepare_filename(info)
+        audio_path = ydl.prepare_filename(info)
+
+    if workspace is not None:
+        workspace.store(video_id, audio_path)
+    return audio_path
+
+
+def _safe_video_id(url: str) -> str:
+    """Return video ID usable as file name, hashing anything unexpected."""
+    video_id = extract_video_id(url)
+    if re.fullmatch(r'[\w-]{1,64}', video_id):
+        return video_id
+    return hashlib.sha256(url.encode()).hexdigest()
 
 
 def _get_download_options(output_template: str) -> dict:
@@ -35,4 +60,4 @@ def _get_download_options(output_template: str) -> dict:
         "outtmpl": output_template,
         "quiet": True,
         "noplaylist": True,
-    }
\ No newline at end of file
+    }
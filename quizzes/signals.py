@@ -0,0 +1,35 @@
+"""Signal handlers keeping the search index and answer key versions in sync."""
+
+from django.db.models.signals import post_save, post_delete, pre_delete
+from django.dispatch import receiver
+from django.utils import timezone
+
+from .models import Quiz, Question
+from .search import reindex_on_commit
+
+
+@receiver(post_save, sender=Quiz)
+def index_saved_quiz(sender, instance, raw=False, **kwargs):
+    """Reindex quiz after create or update."""
+    if not raw:
+        reindex_on_commit(instance.pk)
+
+
+@receiver(pre_delete, sender=Quiz)
+def remove_deleted_quiz(sender, instance, **kwargs):
+    """Drop quiz from the index once its deletion has committed."""
+    reindex_on_commit(instance.pk)
+
+
+@receiver(post_save, sender=Question)
+@receiver(post_delete, sender=Question)
+def index_question_quiz(sender, instance, raw=False, **kwargs):
+    """
+    Reindex the quiz a question belongs to and bump its updated_at.
+
+    updated_at versions the cached answer key (see utils.scoring). It is
+    bumped once per transaction, quizzes saved or deleted in the same
+    transaction are skipped.
+    """
+    if not raw and reindex_on_commit(instance.quiz_id):
+        Quiz.objects.filter(pk=instance.quiz_id).update(updated_at=timezone.now())
@@ -0,0 +1,17 @@
+"""Shared helpers for quiz tests."""
+
+
+def make_quiz_data(title='Photosynthesis', count=10):
+    """Return generated quiz data as produced by generate_quiz()."""
+    return {
+        'title': title,
+        'description': 'How plants turn light into sugar',
+        'questions': [
+            {
+                'question_title': f'Question {i} about chlorophyll',
+                'question_options': ['a', 'b', 'c', 'd'],
+                'answer': 'a'
+            }
+            for i in range(count)
+        ]
+    }
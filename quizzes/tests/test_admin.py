@@ -0,0 +1,83 @@
+"""Tests for query counts of the quiz admin changelists."""
+
+import re
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from quizzes.models import Quiz, Question
+
+# Session, user, count, rows and date hierarchy, independent of row count
+MAX_CHANGELIST_QUERIES = 8
+
+LARGE_TABLES = re.compile(r'FROM "(quizzes_quiz|quizzes_question|auth_user)"')
+
+
+class AdminChangelistQueryTests(TestCase):
+    """Changelist pages run a fixed number of queries however many rows exist."""
+
+    def setUp(self):
+        admin = User.objects.create_superuser('admin', 'admin@example.com', 'secret-pw-123')
+        self.client.force_login(admin)
+
+    def _create_quizzes(self, count, questions=5):
+        """Create quizzes owned by distinct users, each with questions."""
+        offset = Quiz.objects.count()
+        users = User.objects.bulk_create([
+            User(username=f'user{offset + i}') for i in range(count)
+        ])
+        quizzes = Quiz.objects.bulk_create([
+            Quiz(
+                title=f'Quiz {offset + i}',
+                video_url='https://www.youtube.com/watch?v=abc',
+                user=user
+            )
+            for i, user in enumerate(users)
+        ])
+        Question.objects.bulk_create([
+            Question(
+                quiz=quiz,
+                question_title=f'Question {q}',
+                question_options=['a', 'b', 'c', 'd'],
+                answer='a'
+            )
+            for quiz in quizzes
+            for q in range(questions)
+        ])
+
+    def _get_queries(self, url_name) -> list:
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse(url_name))
+        self.assertEqual(response.status_code, 200)
+        return queries.captured_queries
+
+    def _assert_bounded(self, url_name):
+        self._create_quizzes(3)
+        small = self._get_queries(url_name)
+        self._create_quizzes(150)
+        large = self._get_queries(url_name)
+        self.assertEqual(len(small), len(large))
+        self.assertLessEqual(len(large), MAX_CHANGELIST_QUERIES)
+        self.assertEqual(_unbounded_reads(large), [])
+
+    def test_quiz_changelist_query_count(self):
+        self._assert_bounded('admin:quizzes_quiz_changelist')
+
+    def test_question_changelist_query_count(self):
+        self._assert_bounded('admin:quizzes_question_changelist')
+
+
+def _unbounded_reads(queries) -> list:
+    """
+    Return SELECTs loading whole large tables, e.g. for filter choices.
+
+    Only meaningful with more rows than fit on one page, otherwise the
+    changelist legitimately fetches all rows without LIMIT.
+    """
+    return [
+        query['sql'] for query in queries
+        if LARGE_TABLES.search(query['sql'])
+        and not re.search(r'\bLIMIT\b|\b(COUNT|MAX)\(|\bDISTINCT\b', query['sql'])
+    ]
@@ -0,0 +1,112 @@
+"""Tests for attempt submission and the answer key cache."""
+
+from unittest import mock
+from django.contrib.auth.models import User
+from django.core.cache.backends.locmem import LocMemCache
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework_simplejwt.tokens import AccessToken
+
+from quizzes.models import Quiz, Question, Attempt, QuizStats
+from quizzes.tests.helpers import make_quiz_data
+from quizzes.views import CreateQuizView
+from users.tests.helpers import AuthStateResetMixin
+
+
+class QuizAttemptTests(AuthStateResetMixin, TestCase):
+    """Submissions are owner-only and scored against current questions."""
+
+    def setUp(self):
+        super().setUp()
+        self.user = User.objects.create_user('alice', 'alice@example.com', 'secret-pw-123')
+        with self.captureOnCommitCallbacks(execute=True):
+            self.quiz = CreateQuizView()._save_quiz(
+                make_quiz_data(count=3), 'https://www.youtube.com/watch?v=abc', self.user, 'transcript'
+            )
+        self._authenticate(self.user)
+
+    def _authenticate(self, user):
+        self.client.cookies['access_token'] = str(AccessToken.for_user(user))
+
+    def _submit(self, answers, quiz=None):
+        return self.client.post(
+            reverse('quiz_attempts', args=[(quiz or self.quiz).pk]),
+            {'answers': [{'question': pk, 'answer': answer} for pk, answer in answers]},
+            content_type='application/json'
+        )
+
+    def _question_ids(self) -> list:
+        return list(self.quiz.questions.values_list('pk', flat=True))
+
+    def test_owner_submission_is_scored(self):
+        first, second, _ = self._question_ids()
+        response = self._submit([(first, 'a'), (second, 'b')])
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual((response.data['score'], response.data['total']), (1, 3))
+
+    def test_empty_submission_is_rejected(self):
+        response = self._submit([])
+        self.assertEqual(response.status_code, 400)
+        self.assertFalse(Attempt.objects.exists())
+        self.assertFalse(QuizStats.objects.exists())
+
+    def test_other_user_cannot_submit(self):
+        self._authenticate(User.objects.create_user('bob', 'bob@example.com', 'secret-pw-123'))
+        response = self._submit([(self._question_ids()[0], 'a')])
+        self.assertEqual(response.status_code, 403)
+        self.assertFalse(Attempt.objects.exists())
+
+    def test_missing_quiz(self):
+        self.assertEqual(self._submit([(1, 'a')], quiz=Quiz(pk=999999)).status_code, 404)
+
+    def test_foreign_question_is_rejected(self):
+        other = CreateQuizView()._save_quiz(
+            make_quiz_data(count=1), 'https://www.youtube.com/watch?v=def', self.user, ''
+        )
+        response = self._submit([(other.questions.get().pk, 'a')])
+        self.assertEqual(response.status_code, 400)
+
+    def test_regenerate_switches_answer_key_on_other_workers(self):
+        other_worker = LocMemCache('other-worker', {})
+        with mock.patch('quizzes.utils.scoring.cache', other_worker):
+            self.assertEqual(self._submit([(self._question_ids()[0], 'a')]).status_code, 201)
+
+        regenerated = make_quiz_data(count=3)
+        for question in regenerated['questions']:
+            question['answer'] = 'c'
+        with mock.patch('quizzes.views.generate_quiz', return_value=regenerated):
+            response = self.client.post(reverse('quiz_regenerate', args=[self.quiz.pk]))
+        self.assertEqual(response.status_code, 200)
+
+        with mock.patch('quizzes.utils.scoring.cache', other_worker):
+            response = self._submit([(pk, 'c') for pk in self._question_ids()])
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.data['score'], 3)
+
+    def test_edited_answer_applies_on_other_workers(self):
+        other_worker = LocMemCache('other-worker', {})
+        question = self.quiz.questions.first()
+        with mock.patch('quizzes.utils.scoring.cache', other_worker):
+            self.assertEqual(self._submit([(question.pk, 'a')]).data['score'], 1)
+        question.answer = 'b'
+        question.save()
+        with mock.patch('quizzes.utils.scoring.cache', other_worker):
+            self.assertEqual(self._submit([(question.pk, 'b')]).data['score'], 1)
+
+    def test_deleted_question_is_rejected(self):
+        question_id = self._question_ids()[0]
+        self._submit([(question_id, 'a')])
+        Question.objects.get(pk=question_id).delete()
+        self.assertEqual(self._submit([(question_id, 'a')]).status_code, 400)
+
+    def test_question_added_without_signals_is_accepted(self):
+        self._submit([(self._question_ids()[0], 'a')])
+        added = Question.objects.bulk_create([Question(
+            quiz=self.quiz,
+            question_title='Added later',
+            question_options=['a', 'b'],
+            answer='b'
+        )])[0]
+        response = self._submit([(added.pk, 'b')])
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual((response.data['score'], response.data['total']), (1, 4))
@@ -0,0 +1,130 @@
+"""Tests for audio workspaces, the LRU audio cache and the orphan sweep."""
+
+import os
+import time
+import shutil
+import tempfile
+from django.test import SimpleTestCase
+
+from quizzes.utils.audio_workspace import (
+    AudioCache,
+    AudioWorkspace,
+    sweep_orphans,
+    CACHE_DIR,
+    WORKSPACE_DIR
+)
+
+
+def _write(path: str, size: int = 10, age: float = 0):
+    """Create a file of size bytes whose mtime lies age seconds in the past."""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'wb') as f:
+        f.write(b'x' * size)
+    mtime = time.time() - age
+    os.utime(path, (mtime, mtime))
+
+
+class AudioWorkspaceTests(SimpleTestCase):
+    """Workspaces are removed on every exit path."""
+
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.root, ignore_errors=True)
+
+    def test_workspace_removed_after_success(self):
+        with AudioWorkspace(self.root) as workspace:
+            _write(os.path.join(workspace.path, 'audio.mp3'))
+        self.assertFalse(os.path.exists(workspace.path))
+
+    def test_workspace_removed_after_exception(self):
+        with self.assertRaises(RuntimeError):
+            with AudioWorkspace(self.root) as workspace:
+                _write(os.path.join(workspace.path, 'audio.mp3'))
+                raise RuntimeError("transcription failed")
+        self.assertFalse(os.path.exists(workspace.path))
+        self.assertEqual(os.listdir(os.path.join(self.root, WORKSPACE_DIR)), [])
+
+    def test_stored_audio_outlives_workspace(self):
+        with AudioWorkspace(self.root) as workspace:
+            workspace.cache.max_bytes = 100
+            audio_path = os.path.join(workspace.path, 'audio.mp3')
+            _write(audio_path)
+            workspace.store('video', audio_path)
+        with AudioWorkspace(self.root) as workspace:
+            workspace.cache.max_bytes = 100
+            self.assertTrue(os.path.isfile(workspace.checkout('video')))
+
+
+class AudioCacheTests(SimpleTestCase):
+    """The cache stays within its byte budget, evicting oldest files first."""
+
+    def setUp(self):
+        self.path = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.path, ignore_errors=True)
+
+    def test_evict_removes_least_recently_used(self):
+        for name, age in [('old', 30), ('middle', 20), ('new', 10)]:
+            _write(os.path.join(self.path, f'{name}.mp3'), size=10, age=age)
+        AudioCache(self.path, max_bytes=20).evict()
+        self.assertEqual(sorted(os.listdir(self.path)), ['middle.mp3', 'new.mp3'])
+
+    def test_checkout_refreshes_recency(self):
+        target = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, target, ignore_errors=True)
+        for name, age in [('old', 30), ('middle', 20), ('new', 10)]:
+            _write(os.path.join(self.path, f'{name}.mp3'), size=10, age=age)
+        cache = AudioCache(self.path, max_bytes=20)
+        cache.checkout('old', target)
+        cache.evict()
+        self.assertEqual(sorted(os.listdir(self.path)), ['new.mp3', 'old.mp3'])
+
+    def test_store_enforces_budget(self):
+        source = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, source, ignore_errors=True)
+        cache = AudioCache(self.path, max_bytes=25)
+        for name, age in [('first', 30), ('second', 20), ('third', 10)]:
+            audio_path = os.path.join(source, f'{name}.mp3')
+            _write(audio_path, size=10, age=age)
+            cache.store(name, audio_path)
+        self.assertEqual(sorted(os.listdir(self.path)), ['second.mp3', 'third.mp3'])
+
+    def test_zero_budget_disables_cache(self):
+        audio_path = os.path.join(self.path, 'source.mp3')
+        _write(audio_path)
+        cache = AudioCache(os.path.join(self.path, CACHE_DIR), max_bytes=0)
+        cache.store('video', audio_path)
+        self.assertFalse(os.path.exists(cache.path))
+        self.assertIsNone(cache.checkout('video', self.path))
+
+
+class SweepOrphansTests(SimpleTestCase):
+    """Only entries older than max_age are swept, the cache is kept."""
+
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.root, ignore_errors=True)
+
+    def test_sweep_respects_max_age(self):
+        _write(os.path.join(self.root, WORKSPACE_DIR, 'crashed', 'audio.mp3'))
+        os.utime(os.path.join(self.root, WORKSPACE_DIR, 'crashed'), (0, 0))
+        _write(os.path.join(self.root, WORKSPACE_DIR, 'running', 'audio.mp3'))
+        _write(os.path.join(self.root, 'legacy.mp3'), age=3600)
+        _write(os.path.join(self.root, 'recent.mp3'))
+
+        self.assertEqual(sweep_orphans(self.root, max_age=60), 2)
+        self.assertEqual(os.listdir(os.path.join(self.root, WORKSPACE_DIR)), ['running'])
+        self.assertFalse(os.path.exists(os.path.join(self.root, 'legacy.mp3')))
+        self.assertTrue(os.path.exists(os.path.join(self.root, 'recent.mp3')))
+
+    def test_sweep_keeps_cache(self):
+        cache_dir = os.path.join(self.root, CACHE_DIR)
+        _write(os.path.join(cache_dir, 'video.mp3'), age=3600)
+        _write(os.path.join(cache_dir, '.interrupted.tmp'), age=3600)
+        os.utime(cache_dir, (0, 0))
+
+        self.assertEqual(sweep_orphans(self.root, max_age=60), 1)
+        self.assertEqual(os.listdir(cache_dir), ['video.mp3'])
+
+    def test_missing_root(self):
+        self.assertEqual(sweep_orphans(os.path.join(self.root, 'missing'), max_age=0), 0)
+
@@ -0,0 +1,86 @@
+"""Tests for cached and validated quiz generation."""
+
+import json
+from unittest import mock
+from django.core.cache import cache
+from django.test import SimpleTestCase
+
+from quizzes.services import gemini_service
+from quizzes.services.gemini_service import generate_quiz, get_generation_cache_stats
+from quizzes.tests.helpers import make_quiz_data
+
+TRANSCRIPT = 'Plants turn light into sugar.'
+
+
+class GenerateQuizCacheTests(SimpleTestCase):
+    """Identical transcripts reuse one Gemini result, invalid results are never cached."""
+
+    def setUp(self):
+        cache.clear()
+        self.client_mock = mock.Mock()
+        self._respond(make_quiz_data(count=2))
+        patcher = mock.patch.object(
+            gemini_service, '_get_gemini_client', return_value=self.client_mock
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _respond(self, data):
+        text = f"```json\n{json.dumps(data)}\n```"
+        self.client_mock.models.generate_content.return_value = mock.Mock(text=text)
+
+    def _calls(self) -> int:
+        return self.client_mock.models.generate_content.call_count
+
+    def test_hit_skips_client(self):
+        first = generate_quiz(TRANSCRIPT)
+        second = generate_quiz(f'  {TRANSCRIPT.upper()}\n')
+        self.assertEqual(second, first)
+        self.assertEqual(self._calls(), 1)
+        self.assertEqual(
+            get_generation_cache_stats(),
+            {'hits': 1, 'misses': 1, 'bypassed': 0, 'saved_calls': 1}
+        )
+
+    def test_use_cache_false_bypasses_and_refreshes(self):
+        generate_quiz(TRANSCRIPT)
+        self._respond(make_quiz_data(title='Fresh', count=2))
+        self.assertEqual(generate_quiz(TRANSCRIPT, use_cache=False)['title'], 'Fresh')
+        self.assertEqual(generate_quiz(TRANSCRIPT)['title'], 'Fresh')
+        self.assertEqual(self._calls(), 2)
+        self.assertEqual(get_generation_cache_stats()['bypassed'], 1)
+
+    def test_changed_prompt_version_misses(self):
+        generate_quiz(TRANSCRIPT)
+        with mock.patch.object(gemini_service, 'PROMPT_VERSION', 'changed'):
+            generate_quiz(TRANSCRIPT)
+        self.assertEqual(self._calls(), 2)
+        self.assertEqual(get_generation_cache_stats()['misses'], 2)
+
+    def test_malformed_response_is_not_cached(self):
+        payloads = {
+            'no questions': {'title': 't', 'description': 'd'},
+            'empty questions': {'title': 't', 'description': 'd', 'questions': []},
+            'no description': {'title': 't', 'questions': make_quiz_data()['questions']},
+            'no answer': {
+                'title': 't', 'description': 'd',
+                'questions': [{'question_title': 'q', 'question_options': ['a']}]
+            },
+            'not an object': ['t', 'd'],
+        }
+        for name, payload in payloads.items():
+            with self.subTest(name):
+                self._respond(payload)
+                with self.assertRaises(ValueError):
+                    generate_quiz(TRANSCRIPT)
+        self._respond(make_quiz_data(count=2))
+        self.assertEqual(len(generate_quiz(TRANSCRIPT)['questions']), 2)
+        self.assertEqual(self._calls(), len(payloads) + 1)
+
+    def test_invalid_cached_entry_is_regenerated(self):
+        cache.set(
+            gemini_service._generation_cache_key(TRANSCRIPT),
+            {'title': 't', 'description': 'd'}
+        )
+        self.assertEqual(len(generate_quiz(TRANSCRIPT)['questions']), 2)
+        self.assertEqual(self._calls(), 1)
@@ -0,0 +1,126 @@
+"""Tests for NDJSON quiz export and batched import."""
+
+import json
+from datetime import datetime, timezone as dt_timezone
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework_simplejwt.tokens import AccessToken
+
+from quizzes.models import Quiz
+from quizzes.tests.helpers import make_quiz_data
+from quizzes.utils.quiz_transfer import iter_export_lines, import_lines
+from quizzes.views import CreateQuizView
+
+CREATED_AT = datetime(2024, 3, 1, 12, 30, tzinfo=dt_timezone.utc)
+
+
+class QuizTransferTests(TestCase):
+    """Export and import round-trip quizzes and reject invalid lines."""
+
+    def setUp(self):
+        self.alice = User.objects.create_user('alice', 'alice@example.com', 'secret-pw-123')
+        self.bob = User.objects.create_user('bob', 'bob@example.com', 'secret-pw-123')
+        for i in range(3):
+            quiz = CreateQuizView()._save_quiz(
+                make_quiz_data(title=f'Quiz {i}', count=i + 1),
+                f'https://www.youtube.com/watch?v=video{i}',
+                self.alice,
+                f'Transcript {i} über Licht'
+            )
+            Quiz.objects.filter(pk=quiz.pk).update(created_at=CREATED_AT.replace(day=i + 1))
+
+    def _export(self, user) -> list:
+        return list(iter_export_lines(Quiz.objects.filter(user=user)))
+
+    def _line(self, **overrides) -> str:
+        data = {**make_quiz_data(count=1), 'video_url': 'https://www.youtube.com/watch?v=abc'}
+        data.update(overrides)
+        return json.dumps(data)
+
+    def test_round_trip_keeps_all_fields(self):
+        lines = self._export(self.alice)
+        self.assertEqual(import_lines(lines, self.bob), 3)
+        self.assertEqual(self._export(self.bob), lines)
+        self.assertEqual(
+            sorted(Quiz.objects.filter(user=self.bob).values_list('created_at', flat=True)),
+            [CREATED_AT.replace(day=day) for day in (1, 2, 3)]
+        )
+
+    def test_import_inserts_in_batches(self):
+        lines = self._export(self.alice) * 2
+        with CaptureQueriesContext(connection) as queries:
+            self.assertEqual(import_lines(lines, self.bob, batch_size=4), 6)
+        quiz_inserts = [
+            q for q in queries.captured_queries
+            if q['sql'].startswith('INSERT INTO "quizzes_quiz" ')
+        ]
+        self.assertEqual(len(quiz_inserts), 2)
+
+    def test_missing_created_at_uses_import_time(self):
+        import_lines([self._line()], self.bob)
+        self.assertGreater(Quiz.objects.get(user=self.bob).created_at, CREATED_AT)
+
+    def test_invalid_lines_are_rejected(self):
+        long_answer = make_quiz_data(count=1)['questions']
+        long_answer[0]['answer'] = 'x' * 501
+        cases = {
+            'answer': self._line(questions=long_answer),
+            'title': self._line(title='x' * 256),
+            'video_url': self._line(video_url='not a url'),
+            'created_at': self._line(created_at='yesterday'),
+            'description': self._line(description=['not', 'text']),
+        }
+        for field, line in cases.items():
+            with self.subTest(field=field):
+                with self.assertRaisesMessage(ValueError, f'Line 2: {field}'):
+                    import_lines([self._line(), line], self.bob, batch_size=1)
+        self.assertEqual(Quiz.objects.filter(user=self.bob).count(), len(cases))
+
+
+class QuizTransferApiTests(TestCase):
+    """The export and import endpoints work on the requesting user's quizzes."""
+
+    def setUp(self):
+        self.alice = User.objects.create_user('alice', 'alice@example.com', 'secret-pw-123')
+        bob = User.objects.create_user('bob', 'bob@example.com', 'secret-pw-123')
+        CreateQuizView()._save_quiz(
+            make_quiz_data(title='Own'), 'https://www.youtube.com/watch?v=own', self.alice, ''
+        )
+        CreateQuizView()._save_quiz(
+            make_quiz_data(title='Foreign'), 'https://www.youtube.com/watch?v=foreign', bob, ''
+        )
+        self.client.cookies['access_token'] = str(AccessToken.for_user(self.alice))
+
+    def _export(self) -> bytes:
+        response = self.client.get(reverse('quiz_export'))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['Content-Type'], 'application/x-ndjson')
+        return b''.join(response.streaming_content)
+
+    def _import(self, body):
+        return self.client.post(
+            reverse('quiz_import'), body, content_type='application/x-ndjson'
+        )
+
+    def test_export_contains_only_own_quizzes(self):
+        lines = self._export().decode('utf-8').splitlines()
+        self.assertEqual([json.loads(line)['title'] for line in lines], ['Own'])
+
+    def test_import_round_trip(self):
+        response = self._import(self._export())
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.data, {'imported': 1})
+        self.assertEqual(Quiz.objects.filter(user=self.alice, title='Own').count(), 2)
+
+    def test_invalid_import_returns_400(self):
+        response = self._import(b'{"title": "x", "video_url": "javascript:alert(1)"}\n')
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('Line 1: video_url', response.data['detail'])
+
+    def test_requires_authentication(self):
+        self.client.cookies.clear()
+        self.assertEqual(self.client.get(reverse('quiz_export')).status_code, 401)
+        self.assertEqual(self._import(b'').status_code, 401)
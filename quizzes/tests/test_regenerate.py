@@ -0,0 +1,98 @@
+"""Tests for regenerating quiz questions from the stored transcript."""
+
+import json
+from unittest import mock
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework_simplejwt.tokens import AccessToken
+
+from quizzes.services import gemini_service
+from quizzes.tests.helpers import make_quiz_data
+from quizzes.views import CreateQuizView
+
+
+def _generated(titles: list) -> dict:
+    """Return generated quiz data with one question per title."""
+    data = make_quiz_data(title='Regenerated', count=len(titles))
+    for question, title in zip(data['questions'], titles):
+        question['question_title'] = title
+    return data
+
+
+class QuizRegenerateTests(TestCase):
+    """Regenerate replaces all or selected questions and rejects bad output."""
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user('alice', 'alice@example.com', 'secret-pw-123')
+        self.quiz = CreateQuizView()._save_quiz(
+            _generated(['Old 1', 'Old 2', 'Old 3']),
+            'https://www.youtube.com/watch?v=abc',
+            self.user,
+            'Plants turn light into sugar.'
+        )
+        self.client.cookies['access_token'] = str(AccessToken.for_user(self.user))
+        self.gemini = mock.Mock()
+        patcher = mock.patch.object(gemini_service, '_get_gemini_client', return_value=self.gemini)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _respond(self, data):
+        self.gemini.models.generate_content.return_value = mock.Mock(text=json.dumps(data))
+
+    def _regenerate(self, quiz=None, **data):
+        return self.client.post(
+            reverse('quiz_regenerate', args=[(quiz or self.quiz).pk]),
+            data,
+            content_type='application/json'
+        )
+
+    def _titles(self) -> list:
+        return list(self.quiz.questions.values_list('question_title', flat=True))
+
+    def test_replaces_all_questions(self):
+        self._respond(_generated(['New 1', 'New 2']))
+        response = self._regenerate()
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self._titles(), ['New 1', 'New 2'])
+        self.assertEqual([q['question_title'] for q in response.data['questions']], ['New 1', 'New 2'])
+
+    def test_replaces_only_selected_questions(self):
+        first, second, _ = self.quiz.questions.values_list('pk', flat=True)
+        # Kept titles are skipped when picking replacements
+        self._respond(_generated(['Old 3', 'New 1', 'New 2', 'New 3']))
+        response = self._regenerate(question_ids=[first, second])
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self._titles(), ['Old 3', 'New 1', 'New 2'])
+
+    def test_foreign_question_ids_are_rejected(self):
+        other = CreateQuizView()._save_quiz(
+            make_quiz_data(count=1), 'https://www.youtube.com/watch?v=def', self.user, 'x'
+        )
+        response = self._regenerate(question_ids=[other.questions.get().pk])
+        self.assertEqual(response.status_code, 400)
+        self.gemini.models.generate_content.assert_not_called()
+
+    def test_quiz_without_transcript_conflicts(self):
+        quiz = CreateQuizView()._save_quiz(
+            make_quiz_data(count=1), 'https://www.youtube.com/watch?v=def', self.user, ''
+        )
+        self.assertEqual(self._regenerate(quiz).status_code, 409)
+        self.gemini.models.generate_content.assert_not_called()
+
+    def test_malformed_output_returns_400_and_is_not_cached(self):
+        self._respond({'title': 't', 'description': 'd'})
+        response = self._regenerate()
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(self._titles(), ['Old 1', 'Old 2', 'Old 3'])
+
+        self._respond(_generated(['New 1']))
+        gemini_service.generate_quiz(self.quiz.transcript)
+        self.assertEqual(self.gemini.models.generate_content.call_count, 2)
+
+    def test_other_users_quiz_is_forbidden(self):
+        other = User.objects.create_user('bob', 'bob@example.com', 'secret-pw-123')
+        self.client.cookies['access_token'] = str(AccessToken.for_user(other))
+        self.assertEqual(self._regenerate().status_code, 403)
@@ -0,0 +1,81 @@
+"""Tests for keeping the quiz search index in sync."""
+
+from unittest import mock
+from django.contrib.auth.models import User
+from django.db import transaction
+from django.test import TestCase
+
+from quizzes.models import Quiz, Question
+from quizzes.search import search_quizzes
+from quizzes.tests.helpers import make_quiz_data
+from quizzes.views import CreateQuizView, QuizRegenerateView
+
+
+class SearchIndexSyncTests(TestCase):
+    """Each transaction reindexes a changed quiz exactly once."""
+
+    def setUp(self):
+        self.user = User.objects.create_user('alice', 'alice@example.com', 'secret-pw-123')
+
+    def _create_quiz(self):
+        return CreateQuizView()._save_quiz(
+            make_quiz_data(), 'https://www.youtube.com/watch?v=abc', self.user, 'transcript'
+        )
+
+    def test_created_quiz_is_indexed_once(self):
+        with mock.patch('quizzes.search.index_quizzes') as index, \
+                self.captureOnCommitCallbacks(execute=True) as callbacks:
+            quiz = self._create_quiz()
+        self.assertEqual(len(callbacks), 1)
+        index.assert_called_once_with({quiz.pk})
+
+    def test_created_quiz_is_searchable(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            quiz = self._create_quiz()
+        self.assertEqual(search_quizzes(self.user, 'chlorophyll', 10, 0), (1, [quiz.pk]))
+
+    def test_regenerate_reindexes_once(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            quiz = self._create_quiz()
+        with mock.patch('quizzes.search.index_quizzes') as index, \
+                self.captureOnCommitCallbacks(execute=True):
+            QuizRegenerateView()._replace_questions(
+                quiz, make_quiz_data()['questions']
+            )
+        index.assert_called_once_with({quiz.pk})
+
+    def test_questions_changed_in_one_transaction_share_callback(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            quiz = self._create_quiz()
+        with mock.patch('quizzes.search.index_quizzes') as index, \
+                self.captureOnCommitCallbacks(execute=True):
+            with transaction.atomic():
+                for question in Question.objects.filter(quiz=quiz):
+                    question.answer = 'b'
+                    question.save()
+                Quiz.objects.get(pk=quiz.pk).save()
+        index.assert_called_once_with({quiz.pk})
+
+    def test_rolled_back_transaction_does_not_swallow_reindex(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            quiz = self._create_quiz()
+        question = quiz.questions.first()
+        with mock.patch('quizzes.search.index_quizzes') as index, \
+                self.captureOnCommitCallbacks(execute=True) as callbacks:
+            try:
+                with transaction.atomic():
+                    question.save()
+                    raise RuntimeError("rolled back")
+            except RuntimeError:
+                pass
+            with transaction.atomic():
+                question.save()
+        self.assertEqual(len(callbacks), 1)
+        index.assert_called_once_with({quiz.pk})
+
+    def test_deleted_quiz_leaves_index(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            quiz = self._create_quiz()
+        with self.captureOnCommitCallbacks(execute=True):
+            quiz.delete()
+        self.assertEqual(search_quizzes(self.user, 'chlorophyll', 10, 0), (0, []))
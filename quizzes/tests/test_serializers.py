@@ -0,0 +1,89 @@
+"""Parity tests for the values()-based quiz read path."""
+
+from io import StringIO
+from unittest import mock
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from rest_framework.renderers import JSONRenderer
+
+from quizly.renderers import FastJSONRenderer
+from quizzes.models import Quiz, Question
+from quizzes.serializers import QuizSerializer, serialize_quiz_list, serialize_quiz_detail
+
+
+class FastReadPathParityTests(TestCase):
+    """serialize_quiz_* must render byte for byte like QuizSerializer."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user('alice', 'alice@example.com', 'secret-pw-123')
+        other = User.objects.create_user('bob', 'bob@example.com', 'secret-pw-123')
+        quizzes = Quiz.objects.bulk_create([
+            Quiz(
+                title=f'Quiz "{i}" über Photosynthese',
+                description='' if i % 2 else 'Licht → Zucker',
+                video_url='https://www.youtube.com/watch?v=abc',
+                user=other if i == 3 else cls.user
+            )
+            for i in range(6)
+        ])
+        Question.objects.bulk_create([
+            Question(
+                quiz=quiz,
+                question_title=f'Question {q} with "quotes" and ünïcödé',
+                question_options=['a', 'b', 'c', 'd'] if q else [],
+                answer='a'
+            )
+            for quiz in quizzes[1:]
+            for q in range(4)
+        ])
+
+    def _assert_same_bytes(self, expected, actual):
+        self.assertEqual(actual, expected)
+        self.assertEqual(
+            FastJSONRenderer().render(actual),
+            JSONRenderer().render(expected)
+        )
+        with mock.patch('quizly.renderers.orjson', None):
+            self.assertEqual(
+                FastJSONRenderer().render(actual),
+                JSONRenderer().render(expected)
+            )
+
+    def test_list_parity(self):
+        quizzes = Quiz.objects.filter(user=self.user)
+        expected = QuizSerializer(quizzes.prefetch_related('questions'), many=True).data
+        self._assert_same_bytes(expected, serialize_quiz_list(quizzes))
+
+    def test_list_uses_two_queries(self):
+        quizzes = Quiz.objects.filter(user=self.user)
+        with self.assertNumQueries(2):
+            serialize_quiz_list(quizzes)
+
+    def test_empty_list(self):
+        self.assertEqual(serialize_quiz_list(Quiz.objects.none()), [])
+
+    def test_detail_parity(self):
+        for quiz in Quiz.objects.defer('transcript_compressed'):
+            with self.subTest(quiz=quiz.pk):
+                self._assert_same_bytes(QuizSerializer(quiz).data, serialize_quiz_detail(quiz))
+
+    @override_settings(TIME_ZONE='Europe/Berlin')
+    def test_parity_in_local_time_zone(self):
+        quizzes = Quiz.objects.filter(user=self.user)
+        expected = QuizSerializer(quizzes.prefetch_related('questions'), many=True).data
+        self._assert_same_bytes(expected, serialize_quiz_list(quizzes))
+        quiz = quizzes.first()
+        self._assert_same_bytes(QuizSerializer(quiz).data, serialize_quiz_detail(quiz))
+
+
+class BenchmarkCommandTests(TestCase):
+    """benchmark_quiz_reads reports both paths and leaves no rows behind."""
+
+    def test_benchmark_output(self):
+        out = StringIO()
+        call_command('benchmark_quiz_reads', quizzes=3, questions=2, repeat=1, stdout=out)
+        self.assertIn('list: serializer', out.getvalue())
+        self.assertIn('detail: serializer', out.getvalue())
+        self.assertFalse(Quiz.objects.exists())
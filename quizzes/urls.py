@@ -1,10 +1,26 @@
 """URL routing for quiz management endpoints."""
 
 from django.urls import path
-from .views import CreateQuizView, QuizListView, QuizDetailView
+from .views import (
+    CreateQuizView,
+    QuizListView,
+    QuizDetailView,
+    QuizSearchView,
+    QuizExportView,
+    QuizImportView,
+    QuizRegenerateView,
+    QuizAttemptView,
+    QuizStatsView
+)
 
 urlpatterns = [
     path('createQuiz/', CreateQuizView.as_view(), name='create_quiz'),
     path('quizzes/', QuizListView.as_view(), name='quiz_list'),
+    path('quizzes/search/', QuizSearchView.as_view(), name='quiz_search'),
+    path('quizzes/export/', QuizExportView.as_view(), name='quiz_export'),
+    path('quizzes/import/', QuizImportView.as_view(), name='quiz_import'),
     path('quizzes/<int:pk>/', QuizDetailView.as_view(), name='quiz_detail'),
+    path('quizzes/<int:pk>/regenerate/', QuizRegenerateView.as_view(), name='quiz_regenerate'),
+    path('quizzes/<int:pk>/attempts/', QuizAttemptView.as_view(), name='quiz_attempts'),
+    path('quizzes/<int:pk>/stats/', QuizStatsView.as_view(), name='quiz_stats'),
 ]
\ No newline at end of file
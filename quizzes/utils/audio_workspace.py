@@ -0,0 +1,209 @@
+# quizzes/utils/audio_workspace.py
+"""Isolated audio workspaces, LRU audio cache and orphan sweeping."""
+
+import os
+import time
+import uuid
+import shutil
+from django.conf import settings
+
+WORKSPACE_DIR = 'workspaces'
+CACHE_DIR = 'cache'
+
+
+class AudioWorkspace:
+    """
+    Temporary directory for a single download -> transcribe pipeline run.
+
+    Everything written into the workspace is removed when the context
+    manager exits, on success and on every error path. When an audio
+    cache budget is configured, downloaded files are kept in the shared
+    LRU cache so retries of the same video skip the download.
+
+    Usage:
+        with AudioWorkspace() as workspace:
+            audio_path = download_audio(url, workspace)
+            transcript = transcribe_audio(audio_path)
+    """
+
+    def __init__(self, root=None):
+        self.root = str(root or settings.AUDIO_OUTPUT_PATH)
+        self.cache = AudioCache(os.path.join(self.root, CACHE_DIR))
+        self.path = None
+
+    def __enter__(self):
+        workspaces = os.path.join(self.root, WORKSPACE_DIR)
+        os.makedirs(workspaces, exist_ok=True)
+        self.path = os.path.join(workspaces, uuid.uuid4().hex)
+        os.makedirs(self.path)
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        shutil.rmtree(self.path, ignore_errors=True)
+        return False
+
+    def checkout(self, key: str):
+        """Return a workspace-local copy of cached audio for key, or None."""
+        return self.cache.checkout(key, self.path)
+
+    def store(self, key: str, audio_path: str):
+        """Keep a file downloaded into this workspace in the audio cache."""
+        self.cache.store(key, audio_path)
+
+
+class AudioCache:
+    """
+    Size-bounded LRU cache of downloaded audio files on disk.
+
+    Recency is tracked through file modification times, so the cache is
+    shared safely between worker processes without extra bookkeeping.
+    A budget of 0 bytes disables the cache entirely.
+    """
+
+    def __init__(self, path: str, max_bytes=None):
+        self.path = path
+        if max_bytes is None:
+            max_bytes = settings.AUDIO_CACHE_MAX_BYTES
+        self.max_bytes = max_bytes
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_bytes > 0
+
+    def checkout(self, key: str, target_dir: str):
+        """Link a cached file into target_dir, returns its path or None."""
+        if not self.enabled:
+            return None
+        source = self._find(key)
+        if source is None:
+            return None
+        target = os.path.join(target_dir, os.path.basename(source))
+        try:
+            _link_or_copy(source, target)
+            os.utime(source)
+        except FileNotFoundError:
+            return None
+        return target
+
+    def store(self, key: str, audio_path: str):
+        """Add a downloaded file to the cache and enforce the byte budget."""
+        if not self.enabled or os.path.getsize(audio_path) > self.max_bytes:
+            return
+        os.makedirs(self.path, exist_ok=True)
+        ext = os.path.splitext(audio_path)[1]
+        tmp_path = os.path.join(self.path, f".{uuid.uuid4().hex}.tmp")
+        _link_or_copy(audio_path, tmp_path)
+        os.replace(tmp_path, os.path.join(self.path, f"{key}{ext}"))
+        self.evict()
+
+    def evict(self):
+        """Remove least recently used files until the cache fits its budget."""
+        files = []
+        for entry in _list_files(self.path):
+            try:
+                stat = entry.stat()
+            except FileNotFoundError:
+                continue
+            files.append((stat.st_mtime, stat.st_size, entry.path))
+        total = sum(size for _, size, _ in files)
+        for _, size, path in sorted(files):
+            if total <= self.max_bytes:
+                break
+            total -= size
+            _remove_file(path)
+
+    def _find(self, key: str):
+        """Return path of cached file for key regardless of extension."""
+        for entry in _list_files(self.path):
+            if os.path.splitext(entry.name)[0] == key:
+                return entry.path
+        return None
+
+
+def sweep_orphans(root=None, max_age=None) -> int:
+    """
+    Delete workspaces and stray audio files left behind by crashed workers.
+
+    Args:
+        root: Audio directory, defaults to settings.AUDIO_OUTPUT_PATH.
+        max_age: Minimum age in seconds before an entry counts as orphaned,
+            defaults to settings.AUDIO_ORPHAN_MAX_AGE.
+
+    Returns:
+        Number of removed files and directories.
+    """
+    root = str(root or settings.AUDIO_OUTPUT_PATH)
+    if max_age is None:
+        max_age = settings.AUDIO_ORPHAN_MAX_AGE
+    if not os.path.isdir(root):
+        return 0
+    cutoff = time.time() - max_age
+    removed = _sweep_dir(os.path.join(root, WORKSPACE_DIR), cutoff)
+    removed += _sweep_dir(root, cutoff, keep={WORKSPACE_DIR, CACHE_DIR})
+    removed += _sweep_stale_tmp(os.path.join(root, CACHE_DIR), cutoff)
+    return removed
+
+
+def _sweep_dir(path: str, cutoff: float, keep=()) -> int:
+    """Remove direct children of path older than cutoff."""
+    if not os.path.isdir(path):
+        return 0
+    removed = 0
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if entry.name in keep or _mtime(entry) > cutoff:
+                continue
+            if entry.is_dir(follow_symlinks=False):
+                shutil.rmtree(entry.path, ignore_errors=True)
+            else:
+                _remove_file(entry.path)
+            removed += 1
+    return removed
+
+
+def _sweep_stale_tmp(path: str, cutoff: float) -> int:
+    """Remove half-written cache files from interrupted stores."""
+    if not os.path.isdir(path):
+        return 0
+    removed = 0
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if entry.name.endswith('.tmp') and _mtime(entry) <= cutoff:
+                _remove_file(entry.path)
+                removed += 1
+    return removed
+
+
+def _list_files(path: str) -> list:
+    """Return cached audio files, skipping in-progress temp files."""
+    if not os.path.isdir(path):
+        return []
+    with os.scandir(path) as entries:
+        return [
+            entry for entry in entries
+            if entry.is_file() and not entry.name.endswith('.tmp')
+        ]
+
+
+def _link_or_copy(source: str, target: str):
+    """Hard-link source to target, falling back to a copy across devices."""
+    try:
+        os.link(source, target)
+    except OSError:
+        shutil.copy2(source, target)
+
+
+def _remove_file(path: str):
+    """Delete a file, ignoring concurrent removal by another worker."""
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+def _mtime(entry) -> float:
+    """Return modification time of a directory entry, 0 if it vanished."""
+    try:
+        return entry.stat(follow_symlinks=False).st_mtime
+    except FileNotFoundError:
+        return 0.0
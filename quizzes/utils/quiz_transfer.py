@@ -0,0 +1,199 @@
+# quizzes/utils/quiz_transfer.py
+"""Streaming NDJSON export and batched import of quizzes."""
+
+import json
+from datetime import datetime, timezone as dt_timezone
+from functools import partial
+from django.core.exceptions import ValidationError
+from django.core.serializers.json import DjangoJSONEncoder
+from django.core.validators import URLValidator
+from django.db import transaction
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+from ..models import Quiz, Question
+from ..search import index_quizzes
+
+QUESTION_FIELDS = ('question_title', 'question_options', 'answer')
+
+
+def iter_export_lines(quizzes, chunk_size: int = 500):
+    """
+    Yield one NDJSON line per quiz with its questions.
+
+    Args:
+        quizzes: Quiz queryset to export.
+        chunk_size: Quizzes fetched (and questions prefetched) per query.
+
+    Yields:
+        JSON encoded quiz followed by a newline.
+    """
+    rows = quizzes.order_by('pk').prefetch_related('questions')
+    for quiz in rows.iterator(chunk_size=chunk_size):
+        yield json.dumps(
+            _quiz_to_dict(quiz),
+            cls=DjangoJSONEncoder,
+            ensure_ascii=False
+        ) + '\n'
+
+
+def import_lines(lines, user, batch_size: int = 500) -> int:
+    """
+    Create quizzes for user from NDJSON lines in batched transactions.
+
+    Each batch of quizzes and their questions is inserted with two
+    bulk_create calls inside one transaction, so memory use is bounded
+    by batch_size regardless of input size. Exported created_at values
+    are restored, so an export/import round trip keeps quiz dates.
+
+    Args:
+        lines: Iterable of str or bytes lines, one quiz per line.
+        user: Owner of the imported quizzes.
+        batch_size: Quizzes per transaction.
+
+    Returns:
+        Number of imported quizzes.
+
+    Raises:
+        ValueError: If a line is not a valid quiz. Earlier batches stay
+            committed; the message contains the imported count.
+    """
+    batch, imported = [], 0
+    for number, line in enumerate(lines, start=1):
+        if isinstance(line, bytes):
+            line = line.decode('utf-8')
+        if not line.strip():
+            continue
+        try:
+            batch.append(_parse_line(line))
+        except ValueError as e:
+            raise ValueError(
+                f"Line {number}: {e} ({imported} quizzes imported before)."
+            ) from e
+        if len(batch) >= batch_size:
+            imported += _save_batch(batch, user)
+            batch = []
+    if batch:
+        imported += _save_batch(batch, user)
+    return imported
+
+
+def _quiz_to_dict(quiz) -> dict:
+    """Return export representation of quiz and its questions."""
+    return {
+        'title': quiz.title,
+        'description': quiz.description,
+        'video_url': quiz.video_url,
+        'transcript': quiz.transcript,
+        'created_at': quiz.created_at,
+        'questions': [
+            {field: getattr(question, field) for field in QUESTION_FIELDS}
+            for question in quiz.questions.all()
+        ],
+    }
+
+
+def _parse_line(line: str) -> dict:
+    """Decode and validate one exported quiz."""
+    try:
+        data = json.loads(line)
+    except json.JSONDecodeError as e:
+        raise ValueError(f"invalid JSON ({e.msg})") from e
+    if not isinstance(data, dict) or not isinstance(data.get('title'), str):
+        raise ValueError("quiz must be an object with a title")
+    _validate_length(Quiz, 'title', data['title'])
+    if not isinstance(data.get('description') or '', str):
+        raise ValueError("description must be a string")
+    if not isinstance(data.get('transcript', ''), str):
+        raise ValueError("transcript must be a string")
+    _validate_video_url(data.get('video_url') or '')
+    if data.get('created_at') is not None:
+        data['created_at'] = _parse_created_at(data['created_at'])
+    questions = data.get('questions', [])
+    if not isinstance(questions, list):
+        raise ValueError("questions must be a list")
+    for question in questions:
+        _validate_question(question)
+    return data
+
+
+def _validate_question(question):
+    """Check that an exported question has all required fields."""
+    if not isinstance(question, dict):
+        raise ValueError("question must be an object")
+    if not isinstance(question.get('question_title'), str):
+        raise ValueError("question_title must be a string")
+    if not isinstance(question.get('question_options', []), list):
+        raise ValueError("question_options must be a list")
+    if not isinstance(question.get('answer'), str):
+        raise ValueError("answer must be a string")
+    _validate_length(Question, 'answer', question['answer'])
+
+
+def _validate_length(model, field_name: str, value: str):
+    """Reject values the database column cannot hold."""
+    max_length = model._meta.get_field(field_name).max_length
+    if len(value) > max_length:
+        raise ValueError(f"{field_name} must be at most {max_length} characters")
+
+
+def _validate_video_url(url):
+    """Check that video_url is empty or a valid URL fitting its column."""
+    if not isinstance(url, str):
+        raise ValueError("video_url must be a string")
+    if not url:
+        return
+    _validate_length(Quiz, 'video_url', url)
+    try:
+        URLValidator()(url)
+    except ValidationError as e:
+        raise ValueError("video_url must be a valid URL") from e
+
+
+def _parse_created_at(value) -> datetime:
+    """Parse an exported ISO 8601 timestamp, naive values count as UTC."""
+    parsed = parse_datetime(value) if isinstance(value, str) else None
+    if parsed is None:
+        raise ValueError("created_at must be an ISO 8601 datetime")
+    if timezone.is_naive(parsed):
+        parsed = timezone.make_aware(parsed, dt_timezone.utc)
+    return parsed
+
+
+def _save_batch(batch: list, user) -> int:
+    """Insert a batch of quizzes and their questions in one transaction."""
+    with transaction.atomic():
+        quizzes = Quiz.objects.bulk_create([
+            Quiz(
+                title=data['title'],
+                description=data.get('description') or '',
+                video_url=data.get('video_url') or '',
+                transcript=data.get('transcript') or '',
+                user=user
+            )
+            for data in batch
+        ])
+        _restore_created_at(quizzes, batch)
+        Question.objects.bulk_create([
+            Question(
+                quiz=quiz,
+                question_title=q['question_title'],
+                question_options=q.get('question_options', []),
+                answer=q['answer']
+            )
+            for quiz, data in zip(quizzes, batch)
+            for q in data.get('questions', [])
+        ], batch_size=1000)
+        transaction.on_commit(partial(index_quizzes, [q.pk for q in quizzes]))
+    return len(quizzes)
+
+
+def _restore_created_at(quizzes: list, batch: list):
+    """Overwrite auto_now_add timestamps with the exported ones."""
+    restored = []
+    for quiz, data in zip(quizzes, batch):
+        if data.get('created_at') is not None:
+            quiz.created_at = data['created_at']
+            restored.append(quiz)
+    if restored:
+        Quiz.objects.bulk_update(restored, ['created_at'], batch_size=1000)
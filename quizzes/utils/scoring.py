@@ -0,0 +1,61 @@
+# quizzes/utils/scoring.py
+"""Cached answer keys, submission scoring and incremental quiz stats."""
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import F, Value
+from django.db.models.functions import Greatest
+from django.utils import timezone
+
+from ..models import Question, QuizStats
+
+
+def get_answer_key(quiz, refresh=False) -> dict:
+    """
+    Return {question_id: answer} for a quiz, cached between submissions.
+
+    The cache key contains quiz.updated_at, which changes with every
+    change to the quiz or its questions (see quizzes.signals), so all
+    workers switch to a new key without explicit invalidation.
+
+    Args:
+        quiz: Quiz instance, only pk and updated_at are used.
+        refresh: Reload from the database even if a key is cached.
+
+    Returns:
+        Answer key dict.
+    """
+    key = _cache_key(quiz)
+    answer_key = None if refresh else cache.get(key)
+    if answer_key is None:
+        answer_key = dict(
+            Question.objects.filter(quiz_id=quiz.pk).values_list('id', 'answer')
+        )
+        cache.set(key, answer_key, timeout=settings.ANSWER_KEY_CACHE_TTL)
+    return answer_key
+
+
+def score_answers(answer_key: dict, answers: list) -> list:
+    """Return (question_id, selected_answer, is_correct) per given answer."""
+    return [
+        (a['question'], a['answer'], answer_key[a['question']] == a['answer'])
+        for a in answers
+    ]
+
+
+def record_attempt_stats(quiz_id, score: int, total: int):
+    """Add one attempt to the quiz's running totals with a single UPDATE."""
+    changes = {
+        'attempt_count': F('attempt_count') + 1,
+        'score_sum': F('score_sum') + score,
+        'total_sum': F('total_sum') + total,
+        'best_score': Greatest('best_score', Value(score)),
+        'last_attempt_at': timezone.now(),
+    }
+    if not QuizStats.objects.filter(quiz_id=quiz_id).update(**changes):
+        QuizStats.objects.get_or_create(quiz_id=quiz_id)
+        QuizStats.objects.filter(quiz_id=quiz_id).update(**changes)
+
+
+def _cache_key(quiz) -> str:
+    return f'quiz-answer-key:{quiz.pk}:{quiz.updated_at.timestamp()}'
@@ -1,20 +1,30 @@
 """Views for quiz management according to endpoint.md."""
 
-import os
 from rest_framework import status
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.exceptions import PermissionDenied
+from django.db import transaction
+from django.http import StreamingHttpResponse
 from django.shortcuts import get_object_or_404
 
-from .models import Quiz, Question
+from .models import Quiz, Question, Attempt, AttemptAnswer, QuizStats
 from .serializers import (
     QuizSerializer,
     QuizUpdateSerializer,
-    CreateQuizSerializer
+    CreateQuizSerializer,
+    QuizSearchSerializer,
+    RegenerateQuizSerializer,
+    AttemptSubmitSerializer,
+    serialize_quiz_list,
+    serialize_quiz_detail
 )
+from .search import search_quizzes
 from .services import download_audio, transcribe_audio, generate_quiz
+from .utils.audio_workspace import AudioWorkspace
+from .utils.quiz_transfer import iter_export_lines, import_lines
+from .utils.scoring import get_answer_key, score_answers, record_attempt_stats
 
 
 class CreateQuizView(APIView):
@@ -32,8 +42,9 @@ class CreateQuizView(APIView):
             )
 
         url = serializer.validated_data['url']
+        use_cache = not serializer.validated_data['fresh']
         try:
-            quiz = self._create_quiz_from_url(url, request.user)
+            quiz = self._create_quiz_from_url(url, request.user, use_cache)
             return Response(
                 QuizSerializer(quiz).data,
                 status=status.HTTP_201_CREATED
@@ -44,40 +55,38 @@ class CreateQuizView(APIView):
                 status=status.HTTP_400_BAD_REQUEST
             )
 
-    def _create_quiz_from_url(self, url: str, user):
+    def _create_quiz_from_url(self, url: str, user, use_cache: bool = True):
         """Pipeline: Download -> Transcribe -> Generate Quiz."""
-        audio_path = download_audio(url)
-        transcript = transcribe_audio(audio_path)
-        quiz_data = generate_quiz(transcript)
-        quiz = self._save_quiz(quiz_data, url, user)
-        self._cleanup_audio(audio_path)
-        return quiz
+        with AudioWorkspace() as workspace:
+            audio_path = download_audio(url, workspace)
+            transcript = transcribe_audio(audio_path)
+        quiz_data = generate_quiz(transcript, use_cache=use_cache)
+        return self._save_quiz(quiz_data, url, user, transcript)
 
-    def _save_quiz(self, quiz_data: dict, url: str, user):
-        """Save quiz and questions to database."""
-        quiz = Quiz.objects.create(
-            title=quiz_data['title'],
-            description=quiz_data['description'],
-            video_url=url,
-            user=user
-        )
-        self._save_questions(quiz, quiz_data['questions'])
+    def _save_quiz(self, quiz_data: dict, url: str, user, transcript: str):
+        """Save quiz, its transcript and questions in one transaction."""
+        with transaction.atomic():
+            quiz = Quiz.objects.create(
+                title=quiz_data['title'],
+                description=quiz_data['description'],
+                video_url=url,
+                transcript=transcript,
+                user=user
+            )
+            self._save_questions(quiz, quiz_data['questions'])
         return quiz
 
     def _save_questions(self, quiz, questions: list):
-        """Save questions for quiz."""
-        for q in questions:
-            Question.objects.create(
+        """Save questions for quiz with a single INSERT."""
+        Question.objects.bulk_create([
+            Question(
                 quiz=quiz,
                 question_title=q['question_title'],
                 question_options=q['question_options'],
                 answer=q['answer']
             )
-
-    def _cleanup_audio(self, audio_path: str):
-        """Delete temporary audio file."""
-        if os.path.exists(audio_path):
-            os.remove(audio_path)
+            for q in questions
+        ])
 
 
 class QuizListView(APIView):
@@ -88,8 +97,82 @@ class QuizListView(APIView):
     def get(self, request):
         """Return all quizzes for current user."""
         quizzes = Quiz.objects.filter(user=request.user)
-        serializer = QuizSerializer(quizzes, many=True)
-        return Response(serializer.data)
+        return Response(serialize_quiz_list(quizzes))
+
+
+class QuizSearchView(APIView):
+    """GET /api/quizzes/search/?q= - Ranked full-text search of own quizzes."""
+
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request):
+        """Return one page of matching quizzes, best match first."""
+        params = QuizSearchSerializer(data=request.query_params)
+        if not params.is_valid():
+            return Response(params.errors, status=status.HTTP_400_BAD_REQUEST)
+
+        page = params.validated_data['page']
+        page_size = params.validated_data['page_size']
+        total, quiz_ids = search_quizzes(
+            request.user,
+            params.validated_data['q'],
+            limit=page_size,
+            offset=(page - 1) * page_size
+        )
+        return Response({
+            "count": total,
+            "page": page,
+            "page_size": page_size,
+            "results": QuizSerializer(self._load_quizzes(quiz_ids), many=True).data
+        })
+
+    def _load_quizzes(self, quiz_ids: list) -> list:
+        """Fetch quizzes with questions, keeping search rank order."""
+        quizzes = (
+            Quiz.objects.filter(pk__in=quiz_ids)
+            .defer('transcript_compressed')
+            .prefetch_related('questions')
+        )
+        by_id = {quiz.pk: quiz for quiz in quizzes}
+        return [by_id[pk] for pk in quiz_ids if pk in by_id]
+
+
+class QuizExportView(APIView):
+    """GET /api/quizzes/export/ - Stream all own quizzes as NDJSON."""
+
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request):
+        """Stream one JSON line per quiz, memory stays constant."""
+        quizzes = Quiz.objects.filter(user=request.user)
+        response = StreamingHttpResponse(
+            iter_export_lines(quizzes),
+            content_type='application/x-ndjson'
+        )
+        response['Content-Disposition'] = 'attachment; filename="quizzes.ndjson"'
+        return response
+
+
+class QuizImportView(APIView):
+    """POST /api/quizzes/import/ - Import quizzes from an NDJSON body."""
+
+    permission_classes = [IsAuthenticated]
+
+    def post(self, request):
+        """Read the body line by line and insert quizzes in batches."""
+        if request.stream is None:
+            return Response(
+                {"detail": "Request body is empty."},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        try:
+            imported = import_lines(request.stream, request.user)
+        except ValueError as e:
+            return Response(
+                {"detail": str(e)},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        return Response({"imported": imported}, status=status.HTTP_201_CREATED)
 
 
 class QuizDetailView(APIView):
@@ -99,12 +182,12 @@ class QuizDetailView(APIView):
 
     def get(self, request, pk):
         """Return single quiz."""
-        quiz = self._get_user_quiz(pk, request.user)
-        return Response(QuizSerializer(quiz).data)
+        quiz = _get_user_quiz(pk, request.user)
+        return Response(serialize_quiz_detail(quiz))
 
     def patch(self, request, pk):
         """Update quiz title and description."""
-        quiz = self._get_user_quiz(pk, request.user)
+        quiz = _get_user_quiz(pk, request.user)
         serializer = QuizUpdateSerializer(
             quiz,
             data=request.data,
@@ -120,13 +203,164 @@ class QuizDetailView(APIView):
 
     def delete(self, request, pk):
         """Delete quiz permanently."""
-        quiz = self._get_user_quiz(pk, request.user)
+        quiz = _get_user_quiz(pk, request.user)
         quiz.delete()
         return Response(status=status.HTTP_204_NO_CONTENT)
 
-    def _get_user_quiz(self, pk, user):
-        """Get quiz and verify ownership."""
-        quiz = get_object_or_404(Quiz, pk=pk)
-        if quiz.user != user:
-            raise PermissionDenied("Quiz does not belong to user.")
-        return quiz
\ No newline at end of file
+
+class QuizRegenerateView(APIView):
+    """POST /api/quizzes/{id}/regenerate/ - New questions from stored transcript."""
+
+    permission_classes = [IsAuthenticated]
+
+    def post(self, request, pk):
+        """Re-run quiz generation only, without download and transcription."""
+        serializer = RegenerateQuizSerializer(data=request.data)
+        if not serializer.is_valid():
+            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+        quiz = _get_user_quiz(pk, request.user, with_transcript=True)
+        transcript = quiz.transcript
+        if not transcript:
+            return Response(
+                {"detail": "Quiz has no stored transcript, create it again from the video."},
+                status=status.HTTP_409_CONFLICT
+            )
+
+        question_ids = serializer.validated_data.get('question_ids')
+        if question_ids and quiz.questions.filter(pk__in=question_ids).count() != len(set(question_ids)):
+            return Response(
+                {"question_ids": ["Questions do not belong to this quiz."]},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        try:
+            quiz_data = generate_quiz(transcript, use_cache=False)
+        except Exception as e:
+            return Response({"detail": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        self._replace_questions(quiz, quiz_data['questions'], question_ids)
+        return Response(serialize_quiz_detail(quiz))
+
+    def _replace_questions(self, quiz, generated: list, question_ids=None):
+        """Swap all (or the selected) questions for generated ones atomically."""
+        with transaction.atomic():
+            # New updated_at versions the answer key and queues the reindex
+            quiz.save(update_fields=['updated_at'])
+            replaced = quiz.questions.all()
+            if question_ids:
+                replaced = replaced.filter(pk__in=question_ids)
+                generated = self._pick_new_questions(quiz, generated, question_ids)
+            replaced.delete()
+            Question.objects.bulk_create([
+                Question(
+                    quiz=quiz,
+                    question_title=q['question_title'],
+                    question_options=q['question_options'],
+                    answer=q['answer']
+                )
+                for q in generated
+            ])
+
+    def _pick_new_questions(self, quiz, generated: list, question_ids: list) -> list:
+        """Choose one generated question per replaced one, skipping kept titles."""
+        kept = set(
+            quiz.questions.exclude(pk__in=question_ids)
+            .values_list('question_title', flat=True)
+        )
+        fresh = [q for q in generated if q['question_title'] not in kept]
+        return (fresh or generated)[:len(set(question_ids))]
+
+
+class QuizAttemptView(APIView):
+    """POST /api/quizzes/{id}/attempts/ - Submit and score answers."""
+
+    permission_classes = [IsAuthenticated]
+
+    def post(self, request, pk):
+        """Score submission against cached answer key and store it."""
+        serializer = AttemptSubmitSerializer(data=request.data)
+        if not serializer.is_valid():
+            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+        quiz = _get_user_quiz(pk, request.user)
+        answers = serializer.validated_data['answers']
+        answer_key = self._get_answer_key(quiz, answers)
+        if answer_key is None:
+            return Response(
+                {"answers": ["Questions do not belong to this quiz."]},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        results = score_answers(answer_key, answers)
+        attempt = self._save_attempt(quiz.pk, request.user, results, len(answer_key))
+        return Response({
+            "id": attempt.pk,
+            "score": attempt.score,
+            "total": attempt.total,
+            "answers": [
+                {"question": question_id, "answer": answer, "is_correct": is_correct}
+                for question_id, answer, is_correct in results
+            ]
+        }, status=status.HTTP_201_CREATED)
+
+    def _get_answer_key(self, quiz, answers: list):
+        """Return answer key covering all answered questions, reloading once if not."""
+        answer_key = get_answer_key(quiz)
+        if all(a['question'] in answer_key for a in answers):
+            return answer_key
+        answer_key = get_answer_key(quiz, refresh=True)
+        if all(a['question'] in answer_key for a in answers):
+            return answer_key
+        return None
+
+    def _save_attempt(self, quiz_id, user, results: list, total: int):
+        """Insert attempt, all answers in one bulk_create and update stats."""
+        score = sum(1 for _, _, is_correct in results if is_correct)
+        with transaction.atomic():
+            attempt = Attempt.objects.create(
+                quiz_id=quiz_id,
+                user=user,
+                score=score,
+                total=total
+            )
+            AttemptAnswer.objects.bulk_create([
+                AttemptAnswer(
+                    attempt=attempt,
+                    question_id=question_id,
+                    selected_answer=answer,
+                    is_correct=is_correct
+                )
+                for question_id, answer, is_correct in results
+            ])
+            record_attempt_stats(quiz_id, score, total)
+        return attempt
+
+
+class QuizStatsView(APIView):
+    """GET /api/quizzes/{id}/stats/ - Aggregated attempt statistics."""
+
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request, pk):
+        """Return running totals maintained on each submission."""
+        quiz = _get_user_quiz(pk, request.user)
+        stats = QuizStats.objects.filter(quiz=quiz).first() or QuizStats(quiz=quiz)
+        count = stats.attempt_count
+        return Response({
+            "attempt_count": count,
+            "average_score": round(stats.score_sum / count, 2) if count else None,
+            "average_percent": round(100 * stats.score_sum / stats.total_sum, 1) if stats.total_sum else None,
+            "best_score": stats.best_score if count else None,
+            "last_attempt_at": stats.last_attempt_at
+        })
+
+
+def _get_user_quiz(pk, user, with_transcript=False):
+    """Get quiz and verify ownership, transcript is only loaded on request."""
+    quizzes = Quiz.objects.all()
+    if not with_transcript:
+        quizzes = quizzes.defer('transcript_compressed')
+    quiz = get_object_or_404(quizzes, pk=pk)
+    if quiz.user_id != user.pk:
+        raise PermissionDenied("Quiz does not belong to user.")
+    return quiz
\ No newline at end of file
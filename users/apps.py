@@ -0,0 +1,14 @@
+"""App configuration for the users app."""
+
+from django.apps import AppConfig
+
+
+class UsersConfig(AppConfig):
+    """Users app, connects signal handlers and system checks on startup."""
+
+    default_auto_field = 'django.db.models.BigAutoField'
+    name = 'users'
+
+    def ready(self):
+        """Register signal handlers and system checks."""
+        from . import checks, signals  # noqa: F401
@@ -1,20 +1,98 @@
-"""Custom JWT authentication reading tokens from HTTP-Only cookies."""
+"""JWT authentication from HTTP-Only cookies or the Authorization header."""
 
 from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+from django.contrib.auth.models import User
 from django.conf import settings
 
+from .revocation import revocation_store
+from .user_cache import user_cache, user_changed_since
 
-class CookieJWTAuthentication(JWTAuthentication):
-    """JWT authentication using access_token cookie instead of Authorization header."""
+
+class RevocableJWTAuthentication(JWTAuthentication):
+    """Authorization header JWT authentication rejecting revoked tokens."""
 
     def authenticate(self, request):
-        """Authenticate request using access_token cookie, returns (user, token) or None."""
-        raw_token = request.COOKIES.get(
-            settings.SIMPLE_JWT.get('AUTH_COOKIE', 'access_token')
-        )
-        
+        """Authenticate request from its raw token, returns (user, token) or None."""
+        raw_token = self.get_raw_token_from_request(request)
+
         if raw_token is None:
             return None
 
         validated_token = self.get_validated_token(raw_token)
-        return self.get_user(validated_token), validated_token
\ No newline at end of file
+        if revocation_store.is_revoked(validated_token):
+            raise InvalidToken("Token has been revoked.")
+        return self.get_user(validated_token), validated_token
+
+    def get_raw_token_from_request(self, request):
+        """Return raw token from the Authorization header, or None."""
+        header = self.get_header(request)
+        if header is None:
+            return None
+        return self.get_raw_token(header)
+
+    def get_user(self, validated_token):
+        """Resolve user from cache, token claims or database (in that order)."""
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError as e:
+            raise InvalidToken(
+                "Token contained no recognizable user identification"
+            ) from e
+
+        key = user_cache.key_for(user_id, validated_token)
+        user = user_cache.get(key)
+        if user is None:
+            user = self._load_user(user_id, validated_token)
+            user_cache.set(key, user)
+        return user
+
+    def _load_user(self, user_id, validated_token):
+        """Build user from claims when enabled and still valid, else query the database."""
+        if settings.AUTH_USER_FROM_CLAIMS and _claims_usable(user_id, validated_token):
+            return _user_from_claims(user_id, validated_token)
+        return super().get_user(validated_token)
+
+
+class CookieJWTAuthentication(RevocableJWTAuthentication):
+    """JWT authentication using access_token cookie instead of Authorization header."""
+
+    def get_raw_token_from_request(self, request):
+        """Return raw token from the access_token cookie, or None."""
+        return request.COOKIES.get(
+            settings.SIMPLE_JWT.get('AUTH_COOKIE', 'access_token')
+        )
+
+
+def _claims_usable(user_id, validated_token) -> bool:
+    """
+    Check that the token carries user claims issued after the last account change.
+
+    A password change, deactivation or staff change after login marks the
+    user as changed (see users.signals), so older tokens fall back to the
+    database, which rejects inactive users. This relies on the shared
+    cache; with a per-process cache other workers keep trusting the
+    claims until the token expires.
+    """
+    if 'username' not in validated_token:
+        return False
+    auth_time = validated_token.get('auth_time', validated_token.get('iat'))
+    return auth_time is not None and not user_changed_since(user_id, auth_time)
+
+
+def _user_from_claims(user_id, validated_token):
+    """
+    Build an unsaved-looking User from token claims without a query.
+
+    The instance only carries id, username and staff flag; it must never
+    be saved.
+    """
+    user = User(
+        id=user_id,
+        username=validated_token['username'],
+        is_staff=validated_token.get('is_staff', False),
+        is_active=True
+    )
+    user._state.adding = False
+    return user
@@ -0,0 +1,29 @@
+"""System checks for settings the users app relies on."""
+
+from django.conf import settings
+from django.core.checks import Error, Warning, Tags, register
+
+
+@register(Tags.caches)
+def check_login_throttle_cache(app_configs, **kwargs):
+    """Login throttling needs a cache that actually stores counters."""
+    if settings.CACHES['default']['BACKEND'].endswith('.DummyCache'):
+        return [Error(
+            "Login throttling never blocks with DummyCache.",
+            hint="Set CACHE_BACKEND to a shared cache such as RedisCache.",
+            id='users.E001',
+        )]
+    return []
+
+
+@register(Tags.caches, deploy=True)
+def check_login_throttle_shared_cache(app_configs, **kwargs):
+    """Login limits and metrics need a cache shared by all workers."""
+    if settings.CACHES['default']['BACKEND'].endswith('.LocMemCache'):
+        return [Warning(
+            "Login throttle counters are kept per worker process with "
+            "LocMemCache, so the effective limits grow with the worker count.",
+            hint="Set CACHE_BACKEND to a shared cache such as RedisCache.",
+            id='users.W001',
+        )]
+    return []
@@ -0,0 +1,15 @@
+"""Management command printing login throttle counters."""
+
+from django.core.management.base import BaseCommand
+
+from users.throttling import get_login_throttle_metrics
+
+
+class Command(BaseCommand):
+    """Show allowed and blocked login attempts recorded in the cache."""
+
+    help = "Print counters of allowed and blocked login attempts."
+
+    def handle(self, *args, **options):
+        for name, value in get_login_throttle_metrics().items():
+            self.stdout.write(f"{name}: {value}")
@@ -0,0 +1,15 @@
+"""Management command deleting revocation entries of expired tokens."""
+
+from django.core.management.base import BaseCommand
+
+from users.revocation import revocation_store
+
+
+class Command(BaseCommand):
+    """Bulk purge expired rows from the revoked token table."""
+
+    help = "Delete revoked tokens that have expired anyway."
+
+    def handle(self, *args, **options):
+        deleted = revocation_store.purge_expired()
+        self.stdout.write(self.style.SUCCESS(f"Purged {deleted} expired tokens."))
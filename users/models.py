@@ -3,8 +3,19 @@
 # Using Django's default User model
 # No custom user model needed
 
+from django.db import models
 
 
+class RevokedToken(models.Model):
+    """Revoked JWT identified by jti, kept only until the token expires."""
 
+    jti = models.CharField(max_length=255, unique=True)
+    expires_at = models.DateTimeField(db_index=True)
+    revoked_at = models.DateTimeField(auto_now_add=True, db_index=True)
 
+    class Meta:
+        verbose_name = 'Revoked Token'
+        verbose_name_plural = 'Revoked Tokens'
 
+    def __str__(self):
+        return self.jti
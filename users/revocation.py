@@ -0,0 +1,87 @@
+"""Token revocation store with O(1) lookups and expiry-based purging."""
+
+import threading
+from datetime import datetime, timedelta, timezone as dt_timezone
+from django.conf import settings
+from django.utils import timezone
+
+from .models import RevokedToken
+
+
+class RevocationStore:
+    """
+    In-memory set of revoked token jtis backed by the RevokedToken table.
+
+    Lookups are dictionary hits. Every worker pulls rows revoked by other
+    workers at most every TOKEN_REVOCATION_SYNC_INTERVAL seconds, and
+    entries are dropped once the token they refer to has expired.
+    """
+
+    def __init__(self, sync_interval=None):
+        self.sync_interval = (
+            settings.TOKEN_REVOCATION_SYNC_INTERVAL
+            if sync_interval is None else sync_interval
+        )
+        self._revoked = {}
+        self._synced_at = None
+        self._lock = threading.Lock()
+
+    def revoke(self, token):
+        """Revoke a validated simplejwt token until its expiry."""
+        jti = token.get('jti')
+        if not jti:
+            return
+        expires_at = datetime.fromtimestamp(token['exp'], tz=dt_timezone.utc)
+        RevokedToken.objects.bulk_create(
+            [RevokedToken(jti=jti, expires_at=expires_at)],
+            ignore_conflicts=True
+        )
+        with self._lock:
+            self._revoked[jti] = expires_at
+
+    def is_revoked(self, token) -> bool:
+        """Return True if the token's jti has been revoked."""
+        jti = token.get('jti')
+        if not jti:
+            return False
+        now = timezone.now()
+        self._maybe_sync(now)
+        expires_at = self._revoked.get(jti)
+        return expires_at is not None and expires_at > now
+
+    def purge_expired(self) -> int:
+        """Bulk delete rows of tokens that have expired, returns row count."""
+        deleted, _ = RevokedToken.objects.filter(
+            expires_at__lte=timezone.now()
+        ).delete()
+        return deleted
+
+    def clear(self):
+        """Forget in-memory state so the next lookup reloads from the DB."""
+        with self._lock:
+            self._revoked.clear()
+            self._synced_at = None
+
+    def _maybe_sync(self, now):
+        """Load recently revoked jtis from the DB once the interval passed."""
+        synced_at = self._synced_at
+        if synced_at and (now - synced_at).total_seconds() < self.sync_interval:
+            return
+        with self._lock:
+            if self._synced_at is not synced_at:
+                return
+            rows = RevokedToken.objects.filter(expires_at__gt=now)
+            if synced_at:
+                # Overlap by one interval to catch rows committed late
+                since = synced_at - timedelta(seconds=self.sync_interval)
+                rows = rows.filter(revoked_at__gte=since)
+            self._revoked = {
+                jti: expires_at
+                for jti, expires_at in self._revoked.items()
+                if expires_at > now
+            }
+            self._revoked.update(rows.values_list('jti', 'expires_at'))
+            self._synced_at = now
+
+
+revocation_store = RevocationStore()
@@ -0,0 +1,15 @@
+"""Signal handlers keeping the authentication user cache consistent."""
+
+from django.contrib.auth.models import User
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+from .user_cache import user_cache, mark_user_changed
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def invalidate_cached_user(sender, instance, **kwargs):
+    """Drop cached copies after password change, deactivation or deletion."""
+    user_cache.invalidate(instance.pk)
+    mark_user_changed(instance.pk)
@@ -0,0 +1,22 @@
+"""Shared helpers for tests that authenticate requests."""
+
+from django.core.cache import cache
+
+from users.revocation import revocation_store
+from users.user_cache import user_cache
+
+
+class AuthStateResetMixin:
+    """
+    Start each test with empty caches, user cache and revocation store.
+
+    These live outside the test database, so they are not rolled back
+    between tests. Mix into a TestCase or TransactionTestCase and call
+    super().setUp() first when overriding setUp.
+    """
+
+    def setUp(self):
+        super().setUp()
+        cache.clear()
+        user_cache.clear()
+        revocation_store.clear()
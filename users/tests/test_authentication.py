@@ -0,0 +1,66 @@
+"""Tests for user resolution in CookieJWTAuthentication."""
+
+from unittest import mock
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from users.revocation import revocation_store
+from users.tests.helpers import AuthStateResetMixin
+from users.user_cache import user_cache
+from users.views import _create_refresh_token
+
+
+class UserCacheQueryCountTests(AuthStateResetMixin, TestCase):
+    """Per-request query counts of an authenticated quiz list request."""
+
+    def setUp(self):
+        super().setUp()
+        patcher = mock.patch.object(revocation_store, 'sync_interval', 3600)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.user = User.objects.create_user('alice', 'alice@example.com', 'secret-pw-123')
+        self.user.is_staff = True
+        self.user.save()
+        self._login()
+
+    def _login(self):
+        """Issue a fresh token after all account changes of setUp."""
+        cache.clear()
+        token = _create_refresh_token(self.user).access_token
+        self.client.cookies['access_token'] = str(token)
+        self.client.get(reverse('quiz_list'))  # initial revocation sync
+
+    def _count_queries(self) -> int:
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse('quiz_list'))
+        self.assertEqual(response.status_code, 200)
+        return len(queries)
+
+    def test_cached_user_saves_user_query(self):
+        with mock.patch.object(user_cache, 'ttl', 0):
+            uncached = [self._count_queries() for _ in range(3)]
+        cached = [self._count_queries() for _ in range(3)]
+        self.assertEqual(uncached, [2, 2, 2])
+        self.assertEqual(cached, [1, 1, 1])
+
+    @override_settings(AUTH_USER_FROM_CLAIMS=True)
+    def test_claims_user_needs_no_query(self):
+        with mock.patch.object(user_cache, 'ttl', 0):
+            self.assertEqual(self._count_queries(), 1)
+
+    @override_settings(AUTH_USER_FROM_CLAIMS=True)
+    def test_claims_user_keeps_staff_flag(self):
+        response = self.client.get(reverse('quiz_list'))
+        self.assertTrue(response.wsgi_request.user.is_staff)
+
+    @override_settings(AUTH_USER_FROM_CLAIMS=True)
+    def test_deactivation_rejects_claims_token(self):
+        self.assertEqual(self.client.get(reverse('quiz_list')).status_code, 200)
+        self.user.is_active = False
+        self.user.save()
+        user_cache.clear()  # as seen by another worker
+        self.assertEqual(self.client.get(reverse('quiz_list')).status_code, 401)
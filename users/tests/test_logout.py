@@ -0,0 +1,47 @@
+"""Tests for token revocation on logout."""
+
+from django.contrib.auth.models import User
+from django.test import TestCase
+from django.urls import reverse
+
+from users.tests.helpers import AuthStateResetMixin
+
+
+class LogoutRevocationTests(AuthStateResetMixin, TestCase):
+    """Logged-out tokens are rejected by every authentication class."""
+
+    def setUp(self):
+        super().setUp()
+        User.objects.create_user('alice', 'alice@example.com', 'secret-pw-123')
+        response = self.client.post(
+            reverse('login'),
+            {'username': 'alice', 'password': 'secret-pw-123'},
+            content_type='application/json'
+        )
+        self.assertEqual(response.status_code, 200)
+        self.access_token = response.cookies['access_token'].value
+        self.refresh_token = response.cookies['refresh_token'].value
+
+    def _get_quizzes(self, **extra):
+        return self.client.get(reverse('quiz_list'), **extra)
+
+    def test_header_token_works_before_logout(self):
+        self.client.cookies.clear()
+        response = self._get_quizzes(HTTP_AUTHORIZATION=f'Bearer {self.access_token}')
+        self.assertEqual(response.status_code, 200)
+
+    def test_logout_revokes_cookie_and_header_token(self):
+        self.assertEqual(self.client.post(reverse('logout')).status_code, 200)
+
+        self.client.cookies.clear()
+        header = self._get_quizzes(HTTP_AUTHORIZATION=f'Bearer {self.access_token}')
+        self.assertEqual(header.status_code, 401)
+
+        self.client.cookies['access_token'] = self.access_token
+        self.assertEqual(self._get_quizzes().status_code, 401)
+
+    def test_logout_revokes_refresh_token(self):
+        self.client.post(reverse('logout'))
+        self.client.cookies.clear()
+        self.client.cookies['refresh_token'] = self.refresh_token
+        self.assertEqual(self.client.post(reverse('token_refresh')).status_code, 401)
@@ -0,0 +1,68 @@
+"""Tests for login brute-force throttling."""
+
+from io import StringIO
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from users.checks import check_login_throttle_cache, check_login_throttle_shared_cache
+
+
+@override_settings(
+    LOGIN_THROTTLE_IP_RATE='20/min',
+    LOGIN_THROTTLE_USERNAME_RATE='5/min',
+    PASSWORD_HASHERS=['django.contrib.auth.hashers.MD5PasswordHasher']
+)
+class LoginRateThrottleTests(TestCase):
+    """Blocked attempts are counted and answered with 429."""
+
+    def setUp(self):
+        cache.clear()
+        User.objects.create_user('alice', 'alice@example.com', 'secret-pw-123')
+
+    def _login(self, username, **extra):
+        return self.client.post(
+            reverse('login'),
+            {'username': username, 'password': 'wrong'},
+            content_type='application/json',
+            **extra
+        ).status_code
+
+    def test_username_limit(self):
+        with self.assertLogs('users.throttling', 'WARNING'):
+            codes = [self._login('alice') for _ in range(7)]
+        self.assertEqual(codes, [401] * 5 + [429] * 2)
+
+    def test_forwarded_for_does_not_bypass_ip_limit(self):
+        with self.assertLogs('users.throttling', 'WARNING'):
+            codes = [
+                self._login(f'user{i}', HTTP_X_FORWARDED_FOR=f'203.0.113.{i}')
+                for i in range(30)
+            ]
+        self.assertEqual(codes, [401] * 20 + [429] * 10)
+
+    def test_stats_command(self):
+        with self.assertLogs('users.throttling', 'WARNING'):
+            for _ in range(7):
+                self._login('alice')
+        out = StringIO()
+        call_command('login_throttle_stats', stdout=out)
+        self.assertIn('allowed: 5', out.getvalue())
+        self.assertIn('blocked_username: 2', out.getvalue())
+
+
+class LoginThrottleCacheCheckTests(TestCase):
+    """System check for the cache backing the throttle counters."""
+
+    def test_locmem_warns_on_deploy(self):
+        ids = [message.id for message in check_login_throttle_shared_cache(None)]
+        self.assertEqual(ids, ['users.W001'])
+
+    @override_settings(CACHES={'default': {
+        'BACKEND': 'django.core.cache.backends.dummy.DummyCache',
+    }})
+    def test_dummy_cache_is_error(self):
+        ids = [message.id for message in check_login_throttle_cache(None)]
+        self.assertEqual(ids, ['users.E001'])
@@ -0,0 +1,96 @@
+"""Short-lived in-process cache of users resolved from validated JWTs."""
+
+import copy
+import time
+import threading
+from collections import OrderedDict
+from django.conf import settings
+from django.core.cache import cache
+
+
+class UserCache:
+    """
+    Size-bounded TTL cache mapping (user id, token jti) to a User.
+
+    Each worker process keeps its own cache. Invalidation triggered in one
+    worker (logout, password change, deactivation) applies immediately
+    there; other workers pick it up once their entries expire, so the TTL
+    bounds how long a stale user can be served.
+    """
+
+    def __init__(self, ttl=None, max_entries=None):
+        self.ttl = settings.AUTH_USER_CACHE_TTL if ttl is None else ttl
+        self.max_entries = (
+            settings.AUTH_USER_CACHE_MAX_ENTRIES
+            if max_entries is None else max_entries
+        )
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key_for(user_id, validated_token) -> tuple:
+        """Build cache key from user id and the token's jti (or iat)."""
+        token_id = validated_token.get('jti') or validated_token.get('iat')
+        return (str(user_id), token_id)
+
+    def get(self, key):
+        """Return a copy of the cached user, or None if missing or expired."""
+        if self.ttl <= 0:
+            return None
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, user = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+        return copy.copy(user)
+
+    def set(self, key, user):
+        """Store user for key, evicting least recently used entries."""
+        if self.ttl <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, copy.copy(user))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, user_id):
+        """Drop all cached entries of one user."""
+        user_id = str(user_id)
+        with self._lock:
+            for key in [k for k in self._entries if k[0] == user_id]:
+                del self._entries[key]
+
+    def clear(self):
+        """Drop all cached entries."""
+        with self._lock:
+            self._entries.clear()
+
+
+user_cache = UserCache()
+
+
+def mark_user_changed(user_id):
+    """
+    Record in the shared cache when a user's account data changed.
+
+    Tokens authenticated before this moment can no longer be trusted to
+    build a user from claims alone (see user_changed_since). The mark is
+    kept as long as a refresh token lives.
+    """
+    lifetime = settings.SIMPLE_JWT['REFRESH_TOKEN_LIFETIME'].total_seconds()
+    cache.set(_changed_key(user_id), time.time(), timeout=int(lifetime))
+
+
+def user_changed_since(user_id, timestamp) -> bool:
+    """Return True if the user changed at or after the given Unix time."""
+    changed_at = cache.get(_changed_key(user_id))
+    return changed_at is not None and changed_at >= timestamp
+
+
+def _changed_key(user_id) -> str:
+    return f'auth-user-changed:{user_id}'
@@ -9,6 +9,9 @@ from rest_framework_simplejwt.exceptions import TokenError
 from django.conf import settings
 
 from .serializers import RegisterSerializer, LoginSerializer, UserSerializer
+from .revocation import revocation_store
+from .throttling import LoginRateThrottle
+from .user_cache import user_cache
 
 
 def _get_cookie_settings():
@@ -35,6 +38,20 @@ def _get_cookie_name(key):
     return settings.SIMPLE_JWT.get(setting_keys[key], defaults[key])
 
 
+def _create_refresh_token(user):
+    """
+    Create refresh token carrying the claims needed to build request.user.
+
+    auth_time is the login time and, unlike iat, is copied unchanged into
+    every access token derived from this refresh token.
+    """
+    refresh = RefreshToken.for_user(user)
+    refresh['username'] = user.username
+    refresh['is_staff'] = user.is_staff
+    refresh['auth_time'] = refresh['iat']
+    return refresh
+
+
 class RegisterView(APIView):
     """Handle user registration via POST /api/register/."""
 
@@ -56,6 +73,7 @@ class LoginView(APIView):
     """Handle user login via POST /api/login/."""
 
     permission_classes = [AllowAny]
+    throttle_classes = [LoginRateThrottle]
 
     def post(self, request):
         """Authenticate user and set JWT cookies, returns 200 or 401."""
@@ -66,7 +84,7 @@ class LoginView(APIView):
                 status=status.HTTP_401_UNAUTHORIZED
             )
         user = serializer.validated_data['user']
-        refresh = RefreshToken.for_user(user)
+        refresh = _create_refresh_token(user)
         response = Response({
             "detail": "Login successfully!",
             "user": UserSerializer(user).data
@@ -82,10 +100,13 @@ class LogoutView(APIView):
     permission_classes = [IsAuthenticated]
 
     def post(self, request):
-        """Blacklist refresh token and delete auth cookies."""
+        """Revoke refresh and access token and delete auth cookies."""
         refresh_token = request.COOKIES.get(_get_cookie_name('refresh'))
         if refresh_token:
-            self._blacklist_token(refresh_token)
+            self._revoke_refresh_token(refresh_token)
+        if request.auth is not None:
+            revocation_store.revoke(request.auth)
+        user_cache.invalidate(request.user.pk)
         response = Response({
             "detail": "Log-Out successfully! All Tokens will be deleted. "
                       "Refresh token is now invalid."
@@ -93,10 +114,10 @@ class LogoutView(APIView):
         self._delete_auth_cookies(response)
         return response
 
-    def _blacklist_token(self, token_str):
-        """Add token to blacklist, silently ignore invalid tokens."""
+    def _revoke_refresh_token(self, token_str):
+        """Add token to revocation store, silently ignore invalid tokens."""
         try:
-            RefreshToken(token_str).blacklist()
+            revocation_store.revoke(RefreshToken(token_str))
         except TokenError:
             pass
 
@@ -121,7 +142,10 @@ class TokenRefreshView(APIView):
                 status=status.HTTP_401_UNAUTHORIZED
             )
         try:
-            new_access = str(RefreshToken(refresh_token).access_token)
+            refresh = RefreshToken(refresh_token)
+            if revocation_store.is_revoked(refresh):
+                raise TokenError("Token has been revoked.")
+            new_access = str(refresh.access_token)
         except TokenError:
             return Response(
                 {"detail": "Invalid or expired refresh token."},